@@ -0,0 +1,214 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from generators import write_input
+from run import PART_NAMES, discover_days, load_day, phase_name, run_day
+
+# Input sizes per day, in the units each generator uses. Day 8 is a grid side
+# length and its solvers are cubic in it, so its sizes stay small.
+DEFAULT_SIZES = {
+    1: [10_000, 100_000, 1_000_000],
+    2: [10_000, 100_000, 1_000_000],
+    3: [3_000, 30_000, 300_000],
+    4: [10_000, 100_000, 1_000_000],
+    5: [1_000, 10_000, 100_000],
+    6: [10_000, 100_000, 1_000_000],
+    7: [1_000, 10_000, 100_000],
+    8: [25, 50, 100],
+    9: [1_000, 10_000, 100_000],
+}
+
+# Fixed sizes used by the performance regression tests in test/perf_test.py
+PERF_SIZES = {
+    1: 100_000,
+    2: 100_000,
+    3: 30_000,
+    4: 30_000,
+    5: 20_000,
+    6: 100_000,
+    7: 10_000,
+    8: 60,
+    9: 3_000,
+}
+
+PERF_BASELINE = os.path.join(os.path.dirname(__file__), "test", "perf_baseline.json")
+
+# Runs per day for the performance tests, the median of which is compared
+PERF_REPEAT = 9
+
+
+def best_times(day, filename, repeat=1):
+    best = None
+
+    for _ in range(repeat):
+        parse_time, results = run_day(day, filename=filename)
+        times = {"parse": parse_time}
+        for part, (_, part_time) in results.items():
+            times[phase_name(part)] = part_time
+
+        if best is None:
+            best = times
+        else:
+            best = {phase: min(best[phase], times[phase]) for phase in best}
+
+    return best
+
+
+def calibration_seconds(iterations=100_000):
+    # A fixed pure Python workload, timed right before each measured run so
+    # timings can be compared in units of it rather than in seconds that
+    # depend on how busy the machine happens to be
+    start = time.perf_counter()
+    totals = {}
+    for i in range(iterations):
+        totals[i % 1000] = totals.get(i % 1000, 0) + i
+    return time.perf_counter() - start
+
+
+def calibrated_times(day, filename, repeat=PERF_REPEAT):
+    # The fastest time of each phase, and the median of its times in units of
+    # the calibration run before each run
+    seconds = {}
+    ratios = {}
+
+    for _ in range(repeat):
+        # As timeit does, collection is kept out of the timings so they don't
+        # depend on whatever else the process happens to have allocated
+        gc.collect()
+        gc.disable()
+        try:
+            calibration = calibration_seconds()
+            parse_time, results = run_day(day, filename=filename)
+        finally:
+            gc.enable()
+
+        times = {"parse": parse_time}
+        for part, (_, part_time) in results.items():
+            times[phase_name(part)] = part_time
+
+        for phase, phase_time in times.items():
+            seconds[phase] = min(seconds.get(phase, phase_time), phase_time)
+            ratios.setdefault(phase, []).append(phase_time / calibration)
+
+    return seconds, {phase: statistics.median(values) for phase, values in ratios.items()}
+
+
+def peak_memory(day, filename):
+    # Peak bytes allocated during each phase, on top of whatever was already
+    # allocated when the phase started (e.g. the parsed input).
+    module = load_day(day)
+    peaks = {}
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        puzzle_input = module.read_input(filename)
+        peaks["parse"] = tracemalloc.get_traced_memory()[1] - start
+
+        for part in PART_NAMES:
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            getattr(module, phase_name(part))(puzzle_input)
+            peaks[phase_name(part)] = tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+
+    return peaks
+
+
+def benchmark_day(day, size, repeat=1, seed=0, directory=None):
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        filename = write_input(day, size, os.path.join(tmp, f"day{day}-{size}.txt"), seed)
+
+        return {"day": day, "size": size, "seconds": best_times(day, filename, repeat)}
+
+
+def measure_day(day, size, repeat=PERF_REPEAT, seed=0, directory=None):
+    # Timings and memory are taken from separate runs as tracemalloc slows
+    # everything it traces down. Seconds are kept for reference; the
+    # performance tests compare the relative times.
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        filename = write_input(day, size, os.path.join(tmp, f"day{day}-{size}.txt"), seed)
+        seconds, relative = calibrated_times(day, filename, repeat)
+
+        return {
+            "size": size,
+            "seconds": seconds,
+            "relative": relative,
+            "peak_bytes": peak_memory(day, filename),
+        }
+
+
+def load_baseline(filename=PERF_BASELINE):
+    with open(filename) as f:
+        return json.load(f)
+
+
+def write_baseline(filename=PERF_BASELINE, days=None, repeat=PERF_REPEAT, margin=0.5):
+    # Days not re-measured keep their existing entries
+    if os.path.exists(filename):
+        baseline = load_baseline(filename)
+    else:
+        baseline = {"margin": margin, "days": {}}
+
+    baseline["python"] = platform.python_version()
+    for day in days or list(PERF_SIZES):
+        baseline["days"][str(day)] = measure_day(day, PERF_SIZES[day], repeat)
+
+    with open(filename, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+    return baseline
+
+
+def run_benchmarks(days, sizes=None, repeat=1, seed=0):
+    results = []
+
+    for day in days:
+        for size in sizes or DEFAULT_SIZES[day]:
+            result = benchmark_day(day, size, repeat, seed)
+            print(f"Day {day} size {size}: " + ", ".join(
+                f"{phase} {seconds * 1000:.3f} ms" for phase, seconds in result["seconds"].items()
+            ))
+            results.append(result)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each day's solvers on generated inputs of increasing size")
+    parser.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, help="input sizes to use for every selected day")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="runs per size, the fastest is reported")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="benchmark.json", help="where to write the JSON report")
+    parser.add_argument("--write-baseline", action="store_true",
+                        help=f"re-measure the performance test baseline in {os.path.relpath(PERF_BASELINE)} instead")
+    args = parser.parse_args(argv)
+
+    if args.write_baseline:
+        write_baseline(days=args.days, repeat=max(args.repeat, PERF_REPEAT))
+        return
+
+    report = run_benchmarks(args.days or list(discover_days()), args.sizes, args.repeat, args.seed)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -46,33 +46,107 @@
 
 # Find the top three Elves carrying the most Calories. How many Calories are those Elves carrying in total?
 
-from helper_methods import *
+import heapq
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 
+DAY = 1
 
-input = open("input/day1-actual.txt").readlines()
+CHUNK_SIZE = 64 * 1024 * 1024
 
-calorieEntries = list(map(lambda x: x.strip("\n"), input))
+# A line with nothing but whitespace on it, as it ends an Elf's inventory
+# whatever the line endings
+BLANK_LINE = re.compile(rb"\n[^\S\n]*\n")
 
 
-elfNum = 1
-caloriesByElf = { 1 : 0 }
-
-for item in calorieEntries:
-    if item == "":
-        elfNum += 1
-        caloriesByElf[elfNum] = 0
+def input(example=True):
+    if example:
+        filename = f"input/day{DAY}-example.txt"
     else:
-        caloriesByElf.update({elfNum: caloriesByElf.get(elfNum) + int(item)})
+        filename = f"input/day{DAY}-actual.txt"
+
+    return read_input(filename)
+
+
+def read_input(filename):
+    return [line.strip() for line in open(filename).readlines()]
+
+
+def stream_input(filename):
+    with open(filename) as f:
+        for line in f:
+            yield line.strip()
+
+
+def elf_totals(input):
+    # Yields each Elf's total as soon as their inventory ends, so only the
+    # running total is ever held in memory
+    total = 0
+
+    for item in input:
+        if item == "":
+            yield total
+            total = 0
+        else:
+            total += int(item)
+
+    yield total
+
+
+def top_calories(input, k=3):
+    # nlargest keeps a heap of at most k totals: O(n log k) and constant memory
+    return heapq.nlargest(k, elf_totals(input))
+
+
+def chunk_boundaries(data, chunk_size=CHUNK_SIZE):
+    # Byte offsets roughly chunk_size apart, each moved forward to the next
+    # blank line so no Elf's inventory is split between two chunks
+    bounds = [0]
+
+    while len(data) - bounds[-1] > chunk_size:
+        split = BLANK_LINE.search(data, bounds[-1] + chunk_size)
+        if split is None:
+            break
+        bounds.append(split.start() + 1)
+
+    bounds.append(len(data))
+    return bounds
+
+
+def top_calories_in_range(filename, start, end, k=3):
+    with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        elves = BLANK_LINE.split(data[start:end])
+
+    return heapq.nlargest(k, (sum(map(int, elf.split())) for elf in elves))
+
+
+def parallel_top_calories(filename, k=3, workers=None, chunk_size=CHUNK_SIZE):
+    if os.path.getsize(filename) == 0:
+        return top_calories([], k)
+
+    with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        bounds = chunk_boundaries(data, chunk_size)
+
+    with ProcessPoolExecutor(workers) as pool:
+        chunk_results = pool.map(top_calories_in_range, repeat(filename), bounds[:-1], bounds[1:], repeat(k))
+        return heapq.nlargest(k, chain.from_iterable(chunk_results))
+
+
+def part_one(input):
+    return top_calories(input, 1)[0]
 
-maxCalories = max(caloriesByElf.values())
 
-print(f"Max calories per elf = {maxCalories}")
+def part_two(input, k=3):
+    return sum(top_calories(input, k))
 
-sortedCaloriesByElf = sortDictionaryByKey(caloriesByElf, True)
 
-maxCalories = sortedCaloriesByElf[0][1]
-secondCalories = sortedCaloriesByElf[1][1]
-thirdCalories = sortedCaloriesByElf[2][1]
+if __name__ == "__main__":
+    filename = f"input/day{DAY}-actual.txt"
 
+    print(f"Day {DAY}:\n")
 
-print(maxCalories + secondCalories + thirdCalories)
+    print(f"Part One: {part_one(stream_input(filename))}")
+    print(f"Part Two: {part_two(stream_input(filename))}")
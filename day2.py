@@ -42,7 +42,10 @@
 
 # Following the Elf's instructions for the second column, what would your total score be if everything goes exactly according to your strategy guide?
 
-input_file = "input/day2-actual.txt"
+from collections import Counter
+from itertools import permutations
+
+DAY = 2
 
 rock_score = 1
 paper_score = 2
@@ -53,48 +56,152 @@ draw_score = 3
 win_score = 6
 
 
-def part_one():
-    score_per_shape = {'X': rock_score, 'Y': paper_score, 'Z': scissors_score}
-    
-    win_score_by_shape = {
-        'A': {'X': draw_score, 'Y': win_score, 'Z': lose_score},
-        'B': {'X': lose_score, 'Y': draw_score, 'Z': win_score},
-        'C': {'X': win_score, 'Y': lose_score, 'Z': draw_score}
-    }
-    rounds = open(input_file).readlines()
+score_per_shape = {'X': rock_score, 'Y': paper_score, 'Z': scissors_score}
+
+win_score_by_shape = {
+    'A': {'X': draw_score, 'Y': win_score, 'Z': lose_score},
+    'B': {'X': lose_score, 'Y': draw_score, 'Z': win_score},
+    'C': {'X': win_score, 'Y': lose_score, 'Z': draw_score}
+}
+
+score_by_outcome = {'X': lose_score, 'Y': draw_score, 'Z': win_score}
+
+shape_score_by_outcome = {
+    'A': {'X': scissors_score, 'Y': rock_score, 'Z': paper_score},
+    'B': {'X': rock_score, 'Y': paper_score, 'Z': scissors_score},
+    'C': {'X': paper_score, 'Y': scissors_score, 'Z': rock_score }
+}
+
+# Total score of a round for each part, indexed by [opponent][second column]
+# with A/B/C and X/Y/Z numbered 0-2
+part_one_scores = [
+    [score_per_shape[me] + win_score_by_shape[them][me] for me in 'XYZ']
+    for them in 'ABC'
+]
+
+part_two_scores = [
+    [score_by_outcome[outcome] + shape_score_by_outcome[them][outcome] for outcome in 'XYZ']
+    for them in 'ABC'
+]
+
+
+def input(example=True):
+    if example:
+        filename = f"input/day{DAY}-example.txt"
+    else:
+        filename = f"input/day{DAY}-actual.txt"
+
+    return read_input(filename)
+
+
+def read_input(filename):
+    return [line.strip() for line in open(filename).readlines()]
+
+
+ROUNDS = {f"{them} {column}" for them in 'ABC' for column in 'XYZ'}
+
+
+def strategy_histogram(rounds):
+    # Number of rounds for each [opponent][second column] pair
+    counts = Counter(map(str.strip, rounds))
+    # Blank lines aren't rounds, but anything else that isn't one is an error
+    counts.pop("", None)
+
+    invalid = set(counts) - ROUNDS
+    if invalid:
+        raise ValueError(f"Not rounds like 'A X': {sorted(invalid)}")
+
+    return [[counts[f"{them} {column}"] for column in 'XYZ'] for them in 'ABC']
+
+
+def score_histogram(histogram, scores):
+    return sum(
+        histogram[them][column] * scores[them][column]
+        for them in range(3)
+        for column in range(3)
+    )
+
+
+def outcome_score(them_shape_score, me_shape_score):
+    return [draw_score, win_score, lose_score][(me_shape_score - them_shape_score) % 3]
+
+
+def shape_mapping_scores(shape_by_column):
+    # Round scores when the second column is the shape to play, e.g.
+    # {'X': rock_score, 'Y': paper_score, 'Z': scissors_score}
+    return [
+        [shape_by_column[column] + outcome_score(them + 1, shape_by_column[column]) for column in 'XYZ']
+        for them in range(3)
+    ]
+
+
+def outcome_mapping_scores(outcome_by_column):
+    # Round scores when the second column is the outcome needed, e.g.
+    # {'X': lose_score, 'Y': draw_score, 'Z': win_score}
+    offsets = {lose_score: -1, draw_score: 0, win_score: 1}
+
+    return [
+        [outcome_by_column[column] + (them + offsets[outcome_by_column[column]]) % 3 + 1 for column in 'XYZ']
+        for them in range(3)
+    ]
+
+
+def all_shape_decodings(histogram):
+    # Score of every way of reading X/Y/Z as the three shapes
+    decodings = []
+
+    for shapes in permutations([rock_score, paper_score, scissors_score]):
+        shape_by_column = dict(zip('XYZ', shapes))
+        decodings.append((shape_by_column, score_histogram(histogram, shape_mapping_scores(shape_by_column))))
+
+    return decodings
+
+
+def part_one(rounds):
+    return score_histogram(strategy_histogram(rounds), part_one_scores)
+
+
+def part_two(rounds):
+    return score_histogram(strategy_histogram(rounds), part_two_scores)
+
+
+def vectorized_scores(filename):
+    # Scores both parts from one read of the raw bytes. Every round is the four
+    # bytes "A X\n", so the columns are strided views of the buffer and each
+    # part's scores are a single gather from its flattened 3x3 table.
+    import numpy as np
+
+    with open(filename, "rb") as f:
+        raw = f.read()
+
+    # Same lines as read_input accepts: CRLF endings and trailing blank lines
+    # are fine, leaving every round but the last followed by exactly "\n"
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n")
+    raw = raw.rstrip()
 
-    score = 0
+    data = np.frombuffer(raw, dtype=np.uint8)
+    columns = (data[0::4] - ord('A'), data[2::4] - ord('X'))
 
-    for round in rounds:
-        them, me = round.strip().split(" ")
+    if (len(data) % 4 != 3
+            or (data[1::4] != ord(' ')).any()
+            or (data[3::4] != ord('\n')).any()
+            or any((column >= 3).any() for column in columns)):
+        raise ValueError(f"{filename} is not made up of rounds like 'A X'")
 
-        score += score_per_shape.get(me)
+    index = columns[0] * 3 + columns[1]
 
-        score += win_score_by_shape.get(them).get(me)
+    part_one_table = np.array(part_one_scores, dtype=np.uint8).ravel()
+    part_two_table = np.array(part_two_scores, dtype=np.uint8).ravel()
 
-    return score
+    part_one_score = part_one_table[index].sum(dtype=np.int64)
+    part_two_score = part_two_table[index].sum(dtype=np.int64)
 
+    return int(part_one_score), int(part_two_score)
 
-def part_two():
-    score_by_outcome = {'X': lose_score, 'Y': draw_score, 'Z': win_score}
-    shape_score_by_outcome = {
-        'A': {'X': scissors_score, 'Y': rock_score, 'Z': paper_score},
-        'B': {'X': rock_score, 'Y': paper_score, 'Z': scissors_score},
-        'C': {'X': paper_score, 'Y': scissors_score, 'Z': rock_score }
-    }
-    
-    score = 0
-    rounds = open(input_file).readlines()
-    
-    for round in rounds:
-        them, outcome = round.strip().split(" ")
-        
-        score += score_by_outcome.get(outcome)
-        score += shape_score_by_outcome.get(them).get(outcome)
-        
-    return score
-    
 
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
 
-print(f"Part One: {part_one()}")
-print(f"Part Two: {part_two()}")
+    print(f"Part One: {part_one(input(example=False))}")
+    print(f"Part Two: {part_two(input(example=False))}")
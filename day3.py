@@ -58,36 +58,98 @@
 # Find the item type that corresponds to the badges of each three-Elf group. What is the sum of the priorities of those item types?
 
 
-def value_of_item(letter):
-    if letter == letter.capitalize():
-        return ord(letter) - 38
+import string
+import sys
+
+DAY = 3
+
+
+def input(example=True):
+    if example:
+        filename = f"input/day{DAY}-example.txt"
     else:
-        return ord(letter) - 96
+        filename = f"input/day{DAY}-actual.txt"
+
+    return read_input(filename)
+
+
+def read_input(filename):
+    return [line.strip() for line in open(filename).readlines()]
+
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+PRIORITIES = {item: priority for priority, item in enumerate(ITEMS, start=1)}
+
+# Substring containment checks in C beat building and intersecting a set (or
+# an item bitmask) per rucksack, but rescan for every item so are quadratic in
+# the rucksack length. Longer rucksacks than this intersect sets instead.
+SCAN_LIMIT = 256
+
+
+def value_of_item(letter):
+    try:
+        return PRIORITIES[letter]
+    except KeyError:
+        raise ValueError(f"{letter!r} is not an item") from None
 
 
 def find_common_item(rucksack):
-    midway = int(len(rucksack)/2)
+    midway = len(rucksack) // 2
+    second = rucksack[midway:]
+
+    if midway > SCAN_LIMIT:
+        second = set(second)
 
-    return set(rucksack[:midway]).intersection(set(rucksack[midway:])).pop()
+    for item in rucksack[:midway]:
+        if item in second:
+            return item
+
+    raise ValueError(f"No item in both compartments of {rucksack}")
 
 
 def find_badge(group):
-    return set(group[0]).intersection(set(group[1])).intersection(set(group[2])).pop()
+    first, second, third = group
+
+    if len(first) > SCAN_LIMIT:
+        second = set(second).intersection(third)
+        third = second
+
+    for item in first:
+        if item in second and item in third:
+            return item
 
+    raise ValueError(f"No badge shared by {group}")
 
-def part_one(inputFile):
-    rucksacks = open(inputFile).readlines()
 
+def part_one(rucksacks):
     return sum(value_of_item(find_common_item(rucksack)) for rucksack in rucksacks)
 
 
-def part_two(inputFile):
-    rucksacks = [line.strip() for line in open(inputFile).readlines()]
+def rucksack_groups(rucksacks):
+    # Lazily yields each group of three as soon as its last rucksack arrives
+    group = []
 
-    return sum(value_of_item(find_badge(group)) for group in [rucksacks[i:i+3] for i in range(0, len(rucksacks), 3)])
+    for rucksack in rucksacks:
+        group.append(rucksack.strip())
 
-print("Day 3")
+        if len(group) == 3:
+            yield group
+            group = []
 
-print(f"Part One: {part_one('input/day3-actual.txt')}")
-print(f"Part Two: {part_two('input/day3-actual.txt')}")
- 
\ No newline at end of file
+    if group:
+        raise ValueError(f"Input ends with an incomplete group of {len(group)}: {group}")
+
+
+def part_two(rucksacks):
+    return sum(value_of_item(find_badge(group)) for group in rucksack_groups(rucksacks))
+
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
+
+    # `python day3.py -` totals the badges of rucksacks piped in on stdin
+    if sys.argv[1:] == ["-"]:
+        print(f"Part Two: {part_two(sys.stdin)}")
+    else:
+        print(f"Part One: {part_one(input(example=False))}")
+        print(f"Part Two: {part_two(input(example=False))}")
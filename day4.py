@@ -55,40 +55,145 @@
 
 # In how many assignment pairs do the ranges overlap?
 
-def input():
-    lines = open("input/day4-actual.txt").readlines()
-    return [line.strip().split(',') for line in lines]
+DAY = 4
 
 
-def part_one():
-    result = 0
-    for pair in input():
-        first = [int(x) for x in pair[0].split('-')]
-        second = [int(y) for y in pair[1].split('-')]
+def input(example=True):
+    if example:
+        filename = f"input/day{DAY}-example.txt"
+    else:
+        filename = f"input/day{DAY}-actual.txt"
+
+    return read_input(filename)
+
+
+def read_input(filename):
+    return [line.strip().split(',') for line in open(filename).readlines()]
+
+
+def parse_assignment(assignment):
+    start, end = assignment.split('-')
+    return int(start), int(end)
 
-        if (first[0] <= second[0] and first[1] >= second[1]) or (first[0] >= second[0] and first[1] <= second[1]):
+
+def fully_contains(first, second):
+    return (first[0] <= second[0] and first[1] >= second[1]) or (first[0] >= second[0] and first[1] <= second[1])
+
+
+def overlaps(first, second):
+    return first[0] <= second[1] and second[0] <= first[1]
+
+
+def part_one(pairs):
+    result = 0
+    for pair in pairs:
+        if fully_contains(parse_assignment(pair[0]), parse_assignment(pair[1])):
             result += 1
 
     return result
 
 
-def part_two():
+def part_two(pairs):
     result = 0
-    for pair in input():
-        first = set(range(
-            int(pair[0].split('-')[0]),
-            int(pair[0].split('-')[1]) + 1
-        ))
-        second = set(range(
-            int(pair[1].split('-')[0]),
-            int(pair[1].split('-')[1]) + 1
-        ))
-        if len(first.intersection(second)) > 0:
+    for pair in pairs:
+        if overlaps(parse_assignment(pair[0]), parse_assignment(pair[1])):
             result += 1
 
     return result
 
 
-print("Day 4")
-print(f"Part One: {part_one()}")
-print(f"Part Two: {part_two()}")
+def coverage_segments(pairs):
+    # Sweep line over every assignment in the file: yields (start, end, elves)
+    # for each run of consecutive sections covered by the same number of Elves
+    events = []
+    for pair in pairs:
+        for assignment in pair:
+            start, end = parse_assignment(assignment)
+            events.append((start, 1))
+            events.append((end + 1, -1))
+    events.sort()
+
+    covered = 0
+    previous = None
+    for section, change in events:
+        if section != previous and covered > 0:
+            yield previous, section - 1, covered
+
+        covered += change
+        previous = section
+
+
+def most_covered_section(pairs):
+    # Lowest section covered by the most Elves, and how many cover it
+    best = (None, 0)
+    for start, _, elves in coverage_segments(pairs):
+        if elves > best[1]:
+            best = (start, elves)
+
+    return best
+
+
+def sections_covered_at_least(pairs, k):
+    return sum(end - start + 1 for start, end, elves in coverage_segments(pairs) if elves >= k)
+
+
+def overlapping_pairs(pairs):
+    # Indexes of the pairs with an assignment overlapping an assignment of any
+    # other pair. With assignments sorted by start, one overlaps an earlier
+    # assignment if the furthest end so far from another pair reaches it, and a
+    # later one if the next assignment from another pair starts inside it.
+    assignments = sorted(
+        (*parse_assignment(assignment), index)
+        for index, pair in enumerate(pairs)
+        for assignment in pair
+    )
+    result = set()
+
+    # Furthest end seen so far, and the furthest from any other pair
+    furthest = (float('-inf'), None)
+    furthest_other = (float('-inf'), None)
+    for start, end, index in assignments:
+        reach = furthest_other[0] if furthest[1] == index else furthest[0]
+        if reach >= start:
+            result.add(index)
+
+        if end > furthest[0]:
+            if furthest[1] != index:
+                furthest_other = furthest
+            furthest = (end, index)
+        elif index != furthest[1] and end > furthest_other[0]:
+            furthest_other = (end, index)
+
+    # Each pair has two assignments, so the next one from another pair is at
+    # most two places along
+    for position, (_, end, index) in enumerate(assignments):
+        for next_start, _, next_index in assignments[position + 1:position + 3]:
+            if next_index != index:
+                if next_start <= end:
+                    result.add(index)
+                break
+
+    return sorted(result)
+
+
+def vectorized_counts(filename):
+    # Both parts at once: every pair becomes a row of four section IDs and the
+    # containment and overlap checks are comparisons over whole columns
+    import numpy as np
+
+    text = open(filename).read().translate(str.maketrans('-,\n', '   '))
+    sections = np.fromstring(text, dtype=np.int64, sep=' ').reshape(-1, 4)
+    first_start, first_end, second_start, second_end = sections.T
+
+    contained = ((first_start <= second_start) & (first_end >= second_end)) | \
+        ((first_start >= second_start) & (first_end <= second_end))
+    overlapping = (first_start <= second_end) & (second_start <= first_end)
+
+    return int(contained.sum()), int(overlapping.sum())
+
+
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
+
+    print(f"Part One: {part_one(input(example=False))}")
+    print(f"Part Two: {part_two(input(example=False))}")
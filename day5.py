@@ -97,65 +97,291 @@
 
 
 
+import json
+import os
 import re
+from array import array
+from itertools import chain
 
 DAY = 5
 
+LOG_CHUNK_SIZE = 1024 * 1024
+
 def get_input(example = True):
     if example:
-        return open(f"input/day{DAY}-example.txt").readlines()
+        return read_input(f"input/day{DAY}-example.txt")
     else:
-        return open(f"input/day{DAY}-actual.txt").readlines()
+        return read_input(f"input/day{DAY}-actual.txt")
+
+def read_input(filename):
+    return open(filename).readlines()
 
 def parse_movement(line):
-    x = re.search(r"move (\d{1,2}) from (\d{1,2}) to (\d{1,2})", line)
+    x = re.search(r"move (\d+) from (\d+) to (\d+)", line)
     return x.groups()
 
 def get_stacks(input):
     split_point = input.index('\n')
 
-    crate_details = [
-        [level[i: i+3] for i in range(0, len(level), 4)]
-        for level in input[:split_point][:-1]
-    ]
-    crate_details.reverse()
+    # One label per stack on the line below the crates; each crate letter sits
+    # at offset 1 of its 4-character column
+    columns = len(input[split_point - 1].split())
+    stacks = [[] for _ in range(columns)]
 
-    stacks = []
-    columns = len(crate_details[0])
-    for i in range(0, columns):
-        stacks.append([x[i].strip(']').strip('[') for x in crate_details])
+    for level in reversed(input[:split_point - 1]):
+        for i, offset in enumerate(range(1, min(len(level), columns * 4), 4)):
+            crate = level[offset]
+            if crate != ' ':
+                stacks[i].append(crate)
 
-    for stack in stacks:
-        while ('   ' in stack):
-            stack.remove('   ')
     return stacks
 
+# A whole line of the move section, trailing whitespace aside
+MOVE_LINE = re.compile(r"^move (\d+) from (\d+) to (\d+)[^\S\n]*$", re.MULTILINE)
 
-def part_one(input):
-    stacks = get_stacks(input)
-    moves = [parse_movement(line) for line in input[input.index('\n') + 1:]]
+def compile_moves(input):
+    # Every move as a flat array of (count, from, to) triples, from a single
+    # regex pass over the whole move section. The matches are anchored to
+    # whole lines, so there is one per non-blank line only when every line is
+    # a move.
+    move_lines = input[input.index('\n') + 1:]
+    moves = MOVE_LINE.findall(''.join(move_lines))
 
-    for move in moves:
-        [count, fr, to] = [int(x) for x in move]
+    if len(moves) != sum(1 for line in move_lines if line.strip()):
+        raise ValueError("Every move must be of the form 'move N from N to N'")
 
-        for i in range(count):
-            stacks[to - 1].append(stacks[fr - 1].pop())
+    return array('l', map(int, chain.from_iterable(moves)))
 
-    return ''.join([stack[-1] for stack in stacks])
+def compile_input(input):
+    return get_stacks(input), compile_moves(input)
 
-def part_two(input):
-    stacks = get_stacks(input)
-    moves = [parse_movement(line) for line in input[input.index('\n') + 1:]]
+def program_moves(program):
+    moves = iter(program)
+    return zip(moves, moves, moves)
+
+def move_crates(stacks, count, fr, to, keep_order=False):
+    # Moves the top count crates as one block: a slice and an in-place delete,
+    # so the work is proportional to count rather than the source stack height.
+    # Crates moved onto the stack they came from end up where they started.
+    if count == 0 or fr == to:
+        return
+
+    source = stacks[fr - 1]
+    crates = source[-count:]
+    del source[-count:]
+
+    if not keep_order:
+        crates.reverse()
+
+    stacks[to - 1].extend(crates)
+
+def top_crates(stacks):
+    # An empty stack shows as a space
+    return ''.join([stack[-1] if stack else ' ' for stack in stacks])
 
-    for move in moves:
-        [count, fr, to] = [int(x) for x in move]
-        stacks[to-1].extend(stacks[fr-1][-1 * count:])
-        stacks[fr-1] = stacks[fr-1][:-1*count]
 
+def run_program(stacks, program, keep_order=False):
+    # Leaves the compiled stacks untouched so the program can be rerun
+    stacks = [list(stack) for stack in stacks]
 
-    return ''.join([stack[-1] for stack in stacks])
+    for count, fr, to in program_moves(program):
+        move_crates(stacks, count, fr, to, keep_order)
 
-print(f"Day {DAY}:\n")
+    return top_crates(stacks)
 
-print(f"Part One: {part_one(get_input(example=False))}")
-print(f"Part One: {part_two(get_input(example=False))}")
+def run_both_cranes(stacks, program):
+    # Top crates for the CrateMover 9000 and 9001 from one pass over the moves
+    single = [list(stack) for stack in stacks]
+    block = [list(stack) for stack in stacks]
+
+    for count, fr, to in program_moves(program):
+        move_crates(single, count, fr, to)
+        move_crates(block, count, fr, to, keep_order=True)
+
+    return top_crates(single), top_crates(block)
+
+
+def part_one(input):
+    return run_program(*compile_input(input))
+
+def part_two(input):
+    return run_program(*compile_input(input), keep_order=True)
+
+class CraneSimulator:
+    # Follows a crane log that keeps growing: remembers the stacks, how many
+    # moves it has applied and how far into the log file it has read, and can
+    # save all of that to a checkpoint to resume from after a restart
+    def __init__(self, stacks, keep_order=False, moves_applied=0, offset=0) -> None:
+        self.stacks = [list(stack) for stack in stacks]
+        self.keep_order = keep_order
+        self.moves_applied = moves_applied
+        self.offset = offset
+
+    @classmethod
+    def from_log(cls, filename, keep_order=False):
+        # Reads the starting drawing; the moves are picked up by sync
+        drawing = []
+        with open(filename, "rb") as f:
+            for line in iter(f.readline, b""):
+                if line.strip() == b"":
+                    break
+                drawing.append(line.decode())
+            offset = f.tell()
+
+        return cls(get_stacks(drawing + ['\n']), keep_order, offset=offset)
+
+    @classmethod
+    def load(cls, checkpoint):
+        with open(checkpoint) as f:
+            state = json.load(f)
+
+        return cls(
+            [list(stack) for stack in state["stacks"]],
+            state["keep_order"],
+            state["moves_applied"],
+            state["offset"],
+        )
+
+    @classmethod
+    def resume(cls, checkpoint, filename, keep_order=False):
+        if os.path.exists(checkpoint):
+            return cls.load(checkpoint)
+
+        return cls.from_log(filename, keep_order)
+
+    def snapshot(self):
+        return {
+            "stacks": [''.join(stack) for stack in self.stacks],
+            "keep_order": self.keep_order,
+            "moves_applied": self.moves_applied,
+            "offset": self.offset,
+        }
+
+    def save(self, checkpoint):
+        # Written beside the checkpoint then renamed over it, so a crash never
+        # leaves a half-written checkpoint behind
+        temporary = f"{checkpoint}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(temporary, checkpoint)
+
+    def apply(self, line):
+        count, fr, to = [int(x) for x in parse_movement(line)]
+        move_crates(self.stacks, count, fr, to, self.keep_order)
+        self.moves_applied += 1
+
+    def sync(self, filename, checkpoint=None, checkpoint_every=None, final=False):
+        # Applies every complete move appended to the log since the last sync.
+        # A partly written last line is left for the next call, unless final
+        # says the log is finished and its last line just has no newline.
+        if checkpoint_every and checkpoint is None:
+            raise ValueError("checkpoint_every needs a checkpoint file to save to")
+
+        with open(filename, "rb") as f:
+            f.seek(self.offset)
+            pending = b""
+
+            for chunk in iter(lambda: f.read(LOG_CHUNK_SIZE), b""):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+
+                for line in lines:
+                    if line.strip():
+                        self.apply(line.decode())
+                    self.offset += len(line) + 1
+
+                    if checkpoint_every and line.strip() and self.moves_applied % checkpoint_every == 0:
+                        self.save(checkpoint)
+
+            if final and pending.strip():
+                self.apply(pending.decode())
+                self.offset += len(pending)
+
+        if checkpoint is not None:
+            self.save(checkpoint)
+
+        return self.tops()
+
+    def tops(self):
+        return top_crates(self.stacks)
+
+
+def initial_heights(input):
+    split_point = input.index('\n')
+    columns = len(input[split_point - 1].split())
+    heights = [0] * columns
+
+    for level in input[:split_point - 1]:
+        for i, offset in enumerate(range(1, min(len(level), columns * 4), 4)):
+            if level[offset] != ' ':
+                heights[i] += 1
+
+    return heights
+
+def crate_at(input, stack, height):
+    # Crate at a height (0 is the bottom) of a stack in the starting drawing
+    return input[input.index('\n') - 2 - height][stack * 4 + 1]
+
+def trace_top_crates(input, keep_order=False):
+    # Works out the final top crates without building any stacks: follows the
+    # top position of each stack back through the moves to where that crate
+    # started, then reads it from the drawing. Only stack heights and one
+    # position per stack are kept.
+    program = compile_moves(input)
+    heights = initial_heights(input)
+    start_heights = list(heights)
+
+    for count, fr, to in program_moves(program):
+        heights[fr - 1] -= count
+        heights[to - 1] += count
+
+    # Tracked [depth from the top, final stack] positions, keyed by stack
+    tracked = {}
+    for stack, height in enumerate(heights):
+        if height > 0:
+            tracked[stack] = [[0, stack]]
+
+    for i in range(len(program) - 3, -1, -3):
+        count = program[i]
+        fr = program[i + 1] - 1
+        to = program[i + 2] - 1
+
+        # Crates moved onto the stack they came from end up where they started
+        if fr == to:
+            continue
+
+        arrived = tracked.pop(to, [])
+        source = tracked.pop(fr, [])
+        stayed = []
+
+        for position in source:
+            position[0] += count
+
+        for position in arrived:
+            if position[0] < count:
+                if not keep_order:
+                    position[0] = count - 1 - position[0]
+                source.append(position)
+            else:
+                position[0] -= count
+                stayed.append(position)
+
+        if source:
+            tracked[fr] = source
+        if stayed:
+            tracked[to] = stayed
+
+    tops = {}
+    for stack, positions in tracked.items():
+        for depth, final_stack in positions:
+            tops[final_stack] = crate_at(input, stack, start_heights[stack] - 1 - depth)
+
+    return ''.join(tops.get(stack, ' ') for stack in range(len(heights)))
+
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
+
+    single, block = run_both_cranes(*compile_input(get_input(example=False)))
+
+    print(f"Part One: {single}")
+    print(f"Part Two: {block}")
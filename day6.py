@@ -53,17 +53,135 @@ DAY = 6
 
 def get_input(example=False):
     if example:
-        return open(f"input/day{DAY}-example.txt").readline()
+        return read_input(f"input/day{DAY}-example.txt")
     else:
-        return open(f"input/day{DAY}-actual.txt").readline()
+        return read_input(f"input/day{DAY}-actual.txt")
+
+
+def read_input(filename):
+    return open(filename).readline()
+
+
+class MarkerDetector:
+    # Finds markers in a datastream fed in chunks (str or bytes), reporting
+    # each one from the chunk that completes it. Keeps the last index of every
+    # character and the start of the longest run of distinct characters ending
+    # at the latest one; a repeat moves that start straight past the earlier
+    # copy. A length is found the first time the run reaches it.
+    def __init__(self, marker_lengths=(4, 14)) -> None:
+        self.remaining = sorted(set(marker_lengths))
+        self.markers = {}
+        self.position = 0
+        self._last_seen = {}
+        self._run_start = 0
+
+    def done(self) -> bool:
+        return not self.remaining
+
+    def feed(self, chunk) -> list:
+        # Line endings aren't part of the datastream, wherever a chunk splits
+        if isinstance(chunk, str):
+            chunk = chunk.replace("\n", "").replace("\r", "")
+        else:
+            chunk = chunk.replace(b"\n", b"").replace(b"\r", b"")
+
+        found = []
+        remaining = self.remaining
+        last_seen = self._last_seen
+        run_start = self._run_start
+        i = self.position
+
+        for char in chunk:
+            if not remaining:
+                break
+
+            previous = last_seen.get(char, -1)
+            if previous >= run_start:
+                run_start = previous + 1
+            last_seen[char] = i
+            i += 1
+
+            while remaining and i - run_start >= remaining[0]:
+                length = remaining.pop(0)
+                self.markers[length] = i
+                found.append((length, i))
+
+        self._run_start = run_start
+        self.position = i
+        return found
+
+
+async def detect_markers(reader, marker_lengths=(4, 14), chunk_size=64 * 1024):
+    # Yields (length, end position) for each marker as soon as the data that
+    # completes it arrives on an asyncio StreamReader
+    detector = MarkerDetector(marker_lengths)
+
+    while not detector.done():
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            break
+
+        for marker in detector.feed(chunk):
+            yield marker
+
+
+def find_markers(input, marker_lengths=(4, 14)):
+    # End position of the first marker of each length, from one pass. Lengths
+    # with no marker are left out.
+    detector = MarkerDetector(marker_lengths)
+    detector.feed(input)
+    return detector.markers
+
+
+def sliding_any(flags, window):
+    # Column s of the result is whether any of flags[:, s:s + window] is set,
+    # built up by doubling the span covered so it takes log2(window) steps
+    span = 1
+    while span < window:
+        step = min(span, window - span)
+        flags = flags[:, :flags.shape[1] - step] | flags[:, step:]
+        span += step
+
+    return flags
+
+
+def batch_find_markers(buffers, marker_lengths=(4, 14)):
+    # First markers of every buffer at once. The buffers are packed into a
+    # zero-padded 2D uint8 array, one row each. A window of length L has a
+    # repeat if two characters k < L apart in it are equal, so for each k the
+    # equal pairs are compared across whole columns and spread over every
+    # window that contains them. Returns {length: array of end positions}, -1
+    # where a buffer has no marker of that length.
+    import numpy as np
+
+    encoded = [buffer.strip().encode() if isinstance(buffer, str) else buffer.strip() for buffer in buffers]
+    sizes = np.array([len(buffer) for buffer in encoded], dtype=np.int64)
+    width = int(sizes.max(initial=0))
+
+    packed = np.zeros((len(encoded), width), dtype=np.uint8)
+    packed[np.arange(width) < sizes[:, None]] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    markers = {}
+    for length in marker_lengths:
+        starts = width - length + 1
+        if starts <= 0:
+            markers[length] = np.full(len(encoded), -1, dtype=np.int64)
+            continue
+
+        repeated = np.zeros((len(encoded), starts), dtype=bool)
+        for k in range(1, length):
+            equal = packed[:, k:] == packed[:, :-k]
+            # Pairs k apart inside the window starting at s start in [s, s + length - k)
+            repeated |= sliding_any(equal, length - k)
+
+        valid = ~repeated & (np.arange(starts) + length <= sizes[:, None])
+        markers[length] = np.where(valid.any(axis=1), valid.argmax(axis=1) + length, -1)
+
+    return markers
 
 
 def find_end_of_first_marker(input, marker_length):
-    input = list(input.strip())
-    for i in range(0, len(input)):
-        substring = set(input[i:i + marker_length])
-        if len(substring) == marker_length:
-            return i + marker_length
+    return find_markers(input.strip(), [marker_length]).get(marker_length)
 
 
 def part_one(input):
@@ -74,7 +192,10 @@ def part_two(input):
     return find_end_of_first_marker(input, 14)
 
 
-print(f"Day {DAY}:\n")
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
+
+    markers = find_markers(get_input().strip(), [4, 14])
 
-print(f"Part One: {part_one(get_input())}")
-print(f"Part One: {part_two(get_input())}")
+    print(f"Part One: {markers.get(4)}")
+    print(f"Part Two: {markers.get(14)}")
@@ -95,11 +95,19 @@
 
 
 import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
 
 DAY = 7
 
+TOTAL_SPACE = 70000000
+NEEDED_SPACE = 30000000
+
 
 class File:
+    __slots__ = ("_name", "_size")
+
     def __init__(self, name: str, size: int) -> None:
         self._name = name
         self._size = size
@@ -114,64 +122,201 @@ class File:
         return self._name
 
 
+class SizeIndex:
+    # Directories sorted by size, for range queries by bisection
+    __slots__ = ("sizes", "directories")
+
+    def __init__(self, directories) -> None:
+        self.directories = sorted(directories, key=lambda d: d.size())
+        self.sizes = [directory.size() for directory in self.directories]
+
+    def smallest_at_least(self, bound: int):
+        i = bisect_left(self.sizes, bound)
+        if i < len(self.directories):
+            return self.directories[i]
+
+    def largest(self, k: int) -> list:
+        return self.directories[:-k - 1:-1] if k > 0 else []
+
+    def within(self, lo: int, hi: int) -> list:
+        return self.directories[bisect_left(self.sizes, lo):bisect_right(self.sizes, hi)]
+
+
+class DirectoryIndex:
+    # Every directory in a tree by full path, and by name for lookups of a
+    # bare name. One index is shared by all the directories in a tree.
+    __slots__ = ("root", "paths", "names", "size_index")
+
+    def __init__(self, root) -> None:
+        self.root = root
+        self.paths = {}
+        self.names = {}
+        # Built on first use, dropped whenever the tree changes
+        self.size_index = None
+
+    def add(self, directory):
+        self.paths[directory.path()] = directory
+        self.names.setdefault(directory.name(), []).append(directory)
+
+
 class Directory:
+    __slots__ = ("_name", "children", "parent", "_size", "_child_dirs", "_child_files", "_path", "_index")
+
     def __init__(self, name: str, parent_dir_name: str) -> None:
         self._name = name
         self.children = []
+        self.parent = None
+        # Total size of everything below, or None until it is next needed
+        self._size = None
+        self._child_dirs = {}
+        self._child_files = {}
+        self._path = name
+        # Shared with the rest of the tree, created when first needed
+        self._index = None
 
     def size(self) -> int:
-        return sum([child.size() for child in self.children])
+        if self._size is None:
+            self.compute_sizes()
+
+        return self._size
+
+    def compute_sizes(self):
+        # Fills in every missing size below this directory in one post-order
+        # pass, skipping subtrees whose size is still cached
+        order = []
+        stack = [self]
+        while stack:
+            directory = stack.pop()
+            order.append(directory)
+            stack.extend(
+                child for child in directory.children
+                if type(child) == Directory and child._size is None
+            )
+
+        for directory in reversed(order):
+            directory._size = sum(child._size for child in directory.children)
 
     def name(self) -> str:
         return self._name
 
+    def path(self) -> str:
+        return self._path
+
+    def index(self) -> DirectoryIndex:
+        # Only a directory that hasn't been added to another has no index yet
+        if self._index is None:
+            self._index = DirectoryIndex(self)
+            self._index.add(self)
+
+        return self._index
+
     def add_child(self, child):
         self.children.append(child)
 
+        if type(child) == Directory:
+            child.parent = self
+            self._child_dirs[child.name()] = child
+
+            # Move the child and anything already below it into this tree's index
+            index = self.index()
+            for directory in child.directories():
+                directory._path = self._child_path(directory.parent._path, directory.name())
+                directory._index = index
+                index.add(directory)
+        else:
+            self._child_files[child.name()] = child
+
+        self._grow(child.size() if self._size is not None else 0)
+
+    def update_child(self, child):
+        # Adds a child as listed, unless one by that name is already here: that
+        # one is kept, so listing a directory again counts nothing twice, and a
+        # file takes the newly listed size
+        if type(child) == Directory:
+            existing = self._child_dirs.get(child.name())
+        else:
+            existing = self._child_files.get(child.name())
+
+        if existing is None:
+            self.add_child(child)
+            return child
+
+        if type(child) == File and child.size() != existing.size():
+            delta = child.size() - existing.size()
+            existing._size = child.size()
+            self._grow(delta)
+
+        return existing
+
+    def _grow(self, delta: int):
+        if self._index is not None:
+            self._index.size_index = None
+
+        # Cached sizes are kept up to date by adding the change up the
+        # ancestor chain. A directory with no size cached has none cached
+        # above it either, so the walk stops there and nothing is computed
+        # until a size is next asked for.
+        directory = self
+        while directory is not None and directory._size is not None:
+            directory._size += delta
+            directory = directory.parent
+
+    @staticmethod
+    def _child_path(parent_path: str, name: str) -> str:
+        return parent_path.rstrip("/") + "/" + name
+
     def find_child_directory(self, dir_name: str):
-        for child in self.children:
-            if type(child) == Directory and child.name() == dir_name:
-                return child
+        child = self._child_dirs.get(dir_name)
 
-        print(f"Could not find dir {dir_name} as child of {self.name()}")
+        if child is None:
+            print(f"Could not find dir {dir_name} as child of {self.name()}")
 
-    def sum_of_small_dirs(self, bound: int):
-        sum = 0
-        if self.size() <= bound:
-            sum += self.size()
+        return child
 
-        for child in self.children:
-            if type(child) == Directory:
-                sum += child.sum_of_small_dirs(bound)
+    def find_directory(self, path: str):
+        # An absolute path, a path relative to this directory, or the name of
+        # any directory below this one
+        index = self.index()
 
-        return sum
+        if path.startswith("/"):
+            return index.paths.get(path.rstrip("/") or "/")
 
-    def find_small_dirs(self, bound: int = 100_000):
-        dirs = []
+        directory = index.paths.get(self._child_path(self._path, path.rstrip("/")))
+        if directory is not None or "/" in path:
+            return directory
 
-        for child in self.children:
-            if type(child) == Directory:
-                dirs.extend(child.find_small_dirs(bound))
+        prefix = self._child_path(self._path, "")
+        for directory in index.names.get(path, []):
+            if directory._path.startswith(prefix):
+                return directory
 
-        if self.size() <= bound:
-            dirs.append(self)
+    def size_index(self) -> SizeIndex:
+        # Sorted sizes of every directory in the whole tree, built once
+        index = self.index()
+        if index.size_index is None:
+            index.size_index = SizeIndex(index.root.directories())
 
-        return dirs
+        return index.size_index
 
-    def find_large_dirs(self, bound):
-        dirs = []
+    def directories(self):
+        # This directory and every one below it
+        stack = [self]
+        while stack:
+            directory = stack.pop()
+            yield directory
+            stack.extend(child for child in reversed(directory.children) if type(child) == Directory)
+
+    def sum_of_small_dirs(self, bound: int):
+        return sum(directory.size() for directory in self.directories() if directory.size() <= bound)
 
-        for child in self.children:
-            if type(child) == Directory:
-                dirs.extend(child.find_large_dirs(bound))
-        
-        if self.size() >= bound:
-            dirs.append(self)
+    def find_small_dirs(self, bound: int = 100_000):
+        return [directory for directory in self.directories() if directory.size() <= bound]
 
-        return dirs
+    def find_large_dirs(self, bound):
+        return [directory for directory in self.directories() if directory.size() >= bound]
 
     def describe(self) -> list:
-        out = [self.describe_self()]
+        out = [f"- {self.name()} (dir)"]
         child_lines = [child.describe() for child in self.children]
 
         for child_line in child_lines:
@@ -185,53 +330,154 @@ class Directory:
         return f"{self.name()} (dir, size={self.size()})"
 
 
+class FlatTree:
+    # Columnar alternative to the Directory/File object graph: node i has its
+    # parent, own size (0 for directories) and name id in parallel arrays, and
+    # every name is stored once in a shared table. Node 0 is the root, and
+    # nodes are only ever added below existing ones, so every child comes
+    # after its parent.
+    def __init__(self) -> None:
+        self.parents = array('q', [-1])
+        self.sizes = array('q', [0])
+        self.is_dir = array('b', [1])
+        self.name_ids = array('l', [0])
+        self.names = ["/"]
+        self._name_ids = {"/": 0}
+        self._child_dirs = {}
+        self._totals = None
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def _intern(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+
+        return name_id
+
+    def _add(self, parent: int, name: str, size: int, is_dir: int) -> int:
+        name_id = self._intern(name)
+        self.parents.append(parent)
+        self.sizes.append(size)
+        self.is_dir.append(is_dir)
+        self.name_ids.append(name_id)
+        self._totals = None
+
+        return len(self.parents) - 1
+
+    def add_directory(self, parent: int, name: str) -> int:
+        node = self._add(parent, name, 0, 1)
+        self._child_dirs[(parent, self.name_ids[node])] = node
+        return node
+
+    def add_file(self, parent: int, name: str, size: int) -> int:
+        return self._add(parent, name, size, 0)
+
+    def find_child_directory(self, parent: int, dir_name: str):
+        name_id = self._name_ids.get(dir_name)
+        return self._child_dirs.get((parent, name_id))
+
+    def name(self, node: int) -> str:
+        return self.names[self.name_ids[node]]
+
+    def totals(self) -> array:
+        # Subtree sizes of every node from one pass in reverse order: each
+        # node's total is complete before it is added to its parent's
+        if self._totals is None:
+            totals = array('q', self.sizes)
+            parents = self.parents
+            for node in range(len(totals) - 1, 0, -1):
+                totals[parents[node]] += totals[node]
+            self._totals = totals
+
+        return self._totals
+
+    def size(self, node: int = 0) -> int:
+        return self.totals()[node]
+
+    def _directory_totals(self):
+        import numpy as np
+
+        totals = np.frombuffer(self.totals(), dtype=np.int64)
+        is_dir = np.frombuffer(self.is_dir, dtype=np.int8).astype(bool)
+        return np, totals, is_dir
+
+    def sum_of_small_dirs(self, bound: int) -> int:
+        np, totals, is_dir = self._directory_totals()
+        return int(totals[is_dir & (totals <= bound)].sum())
+
+    def find_large_dirs(self, bound: int):
+        # Node ids of every directory of at least bound
+        np, totals, is_dir = self._directory_totals()
+        return np.flatnonzero(is_dir & (totals >= bound))
+
+
 def input(example=True):
     if example:
         fileName = f"input/day{DAY}-example.txt"
     else:
         fileName = f"input/day{DAY}-actual.txt"
 
-    return [line.strip() for line in open(fileName).readlines()]
+    return read_input(fileName)
 
 
-def process_terminal_output(terminal_output) -> Directory:
-    isListing = False
+def read_input(filename):
+    return [line.strip() for line in open(filename).readlines()]
 
-    root = Directory("/", None)
 
-    path = [root]
+class TerminalParser:
+    # Builds a directory tree from terminal output that can arrive in pieces:
+    # the current path, whether a listing is in progress and how far into the
+    # capture file it has read are kept between calls
+    def __init__(self) -> None:
+        self.root = Directory("/", None)
+        self.path = [self.root]
+        self.is_listing = False
+        self.offset = 0
 
-    for line in terminal_output:
-        if isListing:
+    def feed(self, terminal_output) -> Directory:
+        for line in terminal_output:
+            if not self.feed_line(line):
+                break
+
+        return self.root
+
+    def feed_line(self, line) -> bool:
+        # False when the line can't be followed, e.g. a cd into a directory
+        # that hasn't been listed, in which case nothing after it is either
+        if self.is_listing:
             if line.startswith("$"):
-                isListing = False
+                self.is_listing = False
             else:
-                cur_dir = path[-1]
+                cur_dir = self.path[-1]
 
                 d = re.search(r"dir (\w+)", line)
                 f = re.search(r"(\d+) (\w+\.?\w*)", line)
 
+                # A directory listed again keeps what it already has
                 if d is not None:
                     dir_name = d.groups()[0]
-                    cur_dir.add_child(Directory(dir_name, cur_dir.name()))
+                    cur_dir.update_child(Directory(dir_name, cur_dir.name()))
                 elif f is not None:
                     file_size, file_name = f.groups()
-                    cur_dir.add_child(File(file_name, int(file_size)))
+                    cur_dir.update_child(File(file_name, int(file_size)))
 
-                continue
+                return True
 
         if (line == "$ cd /"):
-            path = [root]
+            self.path = [self.root]
 
-            continue
+            return True
 
         if line == "$ cd ..":
-            path.pop()
-            continue
+            self.path.pop()
+            return True
 
         if line.startswith("$ cd "):
             dirName = line[5:]
-            cur_dir = path[-1]
+            cur_dir = self.path[-1]
 
             new_dir = cur_dir.find_child_directory(dirName)
 
@@ -240,6 +486,85 @@ def process_terminal_output(terminal_output) -> Directory:
                     f"Can't find new directory {dirName} - currently in {cur_dir.name()}")
                 file_tree = '\n'.join(cur_dir.describe())
                 print(f"File tree {file_tree}")
+                return False
+
+            self.path.append(new_dir)
+
+            return True
+
+        if line == "$ ls":
+            self.is_listing = True
+            return True
+
+        print(f"Unrecognised input {line}")
+        return True
+
+    def ingest(self, filename, final=False) -> Directory:
+        # Reads only what has been appended to the capture since the last call.
+        # A partly written last line is left for the next call, unless final
+        # says the capture is finished and its last line just has no newline.
+        # The offset only moves past lines that were followed, so a line that
+        # stopped the parser is read again next time.
+        with open(filename, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+
+        lines = [line + b"\n" for line in data.split(b"\n")]
+        lines[-1] = lines[-1][:-1]
+        if not final or not lines[-1].strip():
+            lines.pop()
+
+        for line in lines:
+            if not self.feed_line(line.decode().strip()):
+                break
+            self.offset += len(line)
+
+        return self.root
+
+
+def process_terminal_output(terminal_output, columnar=False) -> Directory:
+    if columnar:
+        return process_terminal_output_columnar(terminal_output)
+
+    return TerminalParser().feed(terminal_output)
+
+
+def process_terminal_output_columnar(terminal_output) -> FlatTree:
+    isListing = False
+
+    tree = FlatTree()
+
+    path = [0]
+
+    for line in terminal_output:
+        if isListing:
+            if line.startswith("$"):
+                isListing = False
+            else:
+                if line.startswith("dir "):
+                    tree.add_directory(path[-1], line[4:])
+                else:
+                    file_size, file_name = line.split(" ", 1)
+                    tree.add_file(path[-1], file_name, int(file_size))
+
+                continue
+
+        if (line == "$ cd /"):
+            path = [0]
+
+            continue
+
+        if line == "$ cd ..":
+            path.pop()
+            continue
+
+        if line.startswith("$ cd "):
+            dirName = line[5:]
+
+            new_dir = tree.find_child_directory(path[-1], dirName)
+
+            if new_dir is None:
+                print(f"Can't find new directory {dirName} - currently in {tree.name(path[-1])}")
                 break
 
             path.append(new_dir)
@@ -252,7 +577,76 @@ def process_terminal_output(terminal_output) -> Directory:
 
         print(f"Unrecognised input {line}")
 
-    return root
+    return tree
+
+
+def stream_directory_sizes(terminal_output):
+    # Yields (path, size) for each directory once it has been left, without
+    # building a tree: only the names, running totals and already entered
+    # subdirectories of the directories on the current path are kept.
+    # Requires each directory to be entered once, depth first, as in every
+    # capture so far; entering one again would split its size, so that raises
+    # a ValueError.
+    names = ["/"]
+    totals = [0]
+    entered = [set()]
+
+    def leave():
+        size = totals.pop()
+        path = "/" + "/".join(names[1:])
+        names.pop()
+        entered.pop()
+        if totals:
+            totals[-1] += size
+        return path, size
+
+    for line in terminal_output:
+        line = line.strip()
+
+        if not line:
+            continue
+
+        if line.startswith("$ cd "):
+            dir_name = line[5:]
+
+            if dir_name == "..":
+                if len(totals) == 1:
+                    raise ValueError("Can't cd .. out of /")
+                yield leave()
+            elif dir_name == "/":
+                while len(totals) > 1:
+                    yield leave()
+            else:
+                if dir_name in entered[-1]:
+                    path = "/" + "/".join(names[1:] + [dir_name])
+                    raise ValueError(f"{path} is entered more than once")
+
+                entered[-1].add(dir_name)
+                names.append(dir_name)
+                totals.append(0)
+                entered.append(set())
+        elif line == "$ ls" or line.startswith("dir "):
+            continue
+        else:
+            file_size, _ = line.split(" ", 1)
+            totals[-1] += int(file_size)
+
+    while totals:
+        yield leave()
+
+
+def streaming_part_one(input):
+    return sum(size for _, size in stream_directory_sizes(input) if size <= 100_000)
+
+
+def streaming_part_two(input):
+    # The space to clear is only known once the root's size is, so every
+    # directory size is kept, as a compact array of ints. The root comes last.
+    sizes = array('q', (size for _, size in stream_directory_sizes(input)))
+
+    space_to_clear = NEEDED_SPACE - (TOTAL_SPACE - sizes[-1])
+
+    return min(size for size in sizes if size >= space_to_clear)
 
 
 def part_one(input):
@@ -262,23 +656,24 @@ def part_one(input):
 
 
 def part_two(input):
-    TOTAL_SPACE = 70000000
-    NEEDED_SPACE = 30000000
-    
     dir = process_terminal_output(input)
 
     free_space = TOTAL_SPACE - dir.size()
     space_to_clear = NEEDED_SPACE - free_space
 
-    possible_dirs = dir.find_large_dirs(space_to_clear)
-
-    smallest_dir = sorted(possible_dirs, key = lambda d: d.size())[0]
+    smallest_dir = dir.size_index().smallest_at_least(space_to_clear)
 
     print(smallest_dir.describe_self())
 
     return smallest_dir.size()
 
-print(f"Day {DAY}:\n")
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
 
-print(f"Part One: {part_one(input(example=False))}")
-print(f"Part One: {part_two(input(example=False))}")
+    # `python day7.py -` sums the small directories of a capture piped in on
+    # stdin without building a tree
+    if sys.argv[1:] == ["-"]:
+        print(f"Part One: {streaming_part_one(sys.stdin)}")
+    else:
+        print(f"Part One: {part_one(input(example=False))}")
+        print(f"Part Two: {part_two(input(example=False))}")
@@ -283,6 +283,10 @@ def input(example=True):
     else:
         filename = f"input/day{DAY}-actual.txt"
 
+    return read_input(filename)
+
+
+def read_input(filename):
     return [line.strip() for line in open(filename).readlines()]
 
 
@@ -389,7 +393,8 @@ def part_two(input, num_knots=10):
     return len(visited)
 
 
-print(f"Day {DAY}:\n")
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
 
-print(f"Part One: {part_one(input(example=False))}")
-print(f"Part One: {part_two(input(example=False))}")
+    print(f"Part One: {part_one(input(example=False))}")
+    print(f"Part Two: {part_two(input(example=False))}")
@@ -8,6 +8,10 @@ def input(example=True):
     else:
         filename = f"input/day{DAY}-actual.txt"
 
+    return read_input(filename)
+
+
+def read_input(filename):
     return [line.strip() for line in open(filename).readlines()]
 
 
@@ -23,7 +27,8 @@ def part_two(input):
     return result
 
 
-print(f"Day {DAY}:\n")
+if __name__ == "__main__":
+    print(f"Day {DAY}:\n")
 
-print(f"Part One: {part_one(input())}")
-print(f"Part One: {part_two(input())}")
+    print(f"Part One: {part_one(input())}")
+    print(f"Part Two: {part_two(input())}")
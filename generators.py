@@ -0,0 +1,189 @@
+import argparse
+import random
+import string
+
+# Synthetic puzzle inputs of arbitrary size. Each generator takes a size and a
+# random.Random and yields input lines (without newlines) in the same format
+# as the files in input/, so the day solvers can read them unchanged.
+
+LETTERS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def generate_day1(size, rng, max_items_per_elf=10):
+    # size: number of calorie lines
+    lines = 0
+    while lines < size:
+        if lines > 0:
+            yield ""
+        for _ in range(min(rng.randint(1, max_items_per_elf), size - lines)):
+            yield str(rng.randint(1000, 70000))
+            lines += 1
+
+
+def generate_day2(size, rng):
+    # size: number of rounds
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+def generate_day3(size, rng, half_length=12):
+    # size: number of rucksacks, rounded up to whole groups of three. Every
+    # rucksack has exactly one item in both halves and every group exactly one
+    # badge, so members draw their other items from disjoint pools.
+    for _ in range(0, size, 3):
+        letters = list(LETTERS)
+        rng.shuffle(letters)
+        badge = letters.pop()
+        pools = [letters[i::3] for i in range(3)]
+
+        for pool in pools:
+            common = pool[0]
+            left_pool = pool[1:9]
+            right_pool = pool[9:]
+
+            left = [badge, common] + [rng.choice(left_pool) for _ in range(half_length - 2)]
+            right = [common] + [rng.choice(right_pool) for _ in range(half_length - 1)]
+            rng.shuffle(left)
+            rng.shuffle(right)
+
+            yield "".join(left) + "".join(right)
+
+
+def generate_day4(size, rng, max_section=99):
+    # size: number of assignment pairs
+    for _ in range(size):
+        ranges = []
+        for _ in range(2):
+            start = rng.randint(1, max_section)
+            end = rng.randint(start, max_section)
+            ranges.append(f"{start}-{end}")
+        yield ",".join(ranges)
+
+
+def generate_day5(size, rng, num_stacks=9, initial_height=8, max_count=30):
+    # size: number of moves. Moves never empty a stack, so every stack still
+    # has a top crate at the end.
+    heights = [rng.randint(initial_height // 2, initial_height) for _ in range(num_stacks)]
+
+    for level in range(max(heights), 0, -1):
+        yield " ".join(
+            f"[{rng.choice(string.ascii_uppercase)}]" if height >= level else "   "
+            for height in heights
+        )
+    yield " ".join(f"{i + 1:^3}" for i in range(num_stacks))
+    yield ""
+
+    for _ in range(size):
+        fr = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        to = rng.choice([i for i in range(num_stacks) if i != fr])
+        count = rng.randint(1, min(max_count, heights[fr] - 1))
+
+        heights[fr] -= count
+        heights[to] += count
+
+        yield f"move {count} from {fr + 1} to {to + 1}"
+
+
+def generate_day6(size, rng):
+    # size: length of the datastream. Only three distinct characters appear
+    # until the final 14, so both markers sit at the very end of the buffer.
+    noise = "".join(rng.choice("abc") for _ in range(max(size - 14, 0)))
+    yield noise + "defghijklmnopq"
+
+
+def generate_day7(size, rng, max_depth=20):
+    # size: number of files and directories listed. The tree is built first so
+    # each directory is listed exactly once, then walked depth first.
+    names = ["/"]
+    contents = [[]]
+    parents = [None]
+    depths = [0]
+    current = 0
+
+    for n in range(size):
+        if depths[current] < max_depth and rng.random() < 0.3:
+            names.append(f"d{n}")
+            contents.append([])
+            parents.append(current)
+            depths.append(depths[current] + 1)
+            contents[current].append(f"dir {names[-1]}")
+            if rng.random() < 0.7:
+                current = len(contents) - 1
+        else:
+            contents[current].append(f"{rng.randint(1, 300_000)} f{n}.txt")
+
+        if current != 0 and rng.random() < 0.1:
+            current = parents[current]
+
+    subdirs = [[] for _ in contents]
+    for index, parent in enumerate(parents[1:], start=1):
+        subdirs[parent].append(index)
+
+    yield "$ cd /"
+    yield "$ ls"
+    yield from contents[0]
+
+    stack = [iter(subdirs[0])]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            if stack:
+                yield "$ cd .."
+            continue
+
+        yield f"$ cd {names[child]}"
+        yield "$ ls"
+        yield from contents[child]
+        stack.append(iter(subdirs[child]))
+
+
+def generate_day8(size, rng):
+    # size: width and height of the tree grid
+    for _ in range(size):
+        yield "".join(rng.choice(string.digits) for _ in range(size))
+
+
+def generate_day9(size, rng, max_steps=20):
+    # size: number of moves
+    for _ in range(size):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, max_steps)}"
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+}
+
+
+def write_input(day, size, filename, seed=0):
+    rng = random.Random(seed)
+
+    with open(filename, "w") as f:
+        for line in GENERATORS[day](size, rng):
+            f.write(line)
+            f.write("\n")
+
+    return filename
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic puzzle input of a given size")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("output")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    write_input(args.day, args.size, args.output, args.seed)
+
+
+if __name__ == "__main__":
+    main()
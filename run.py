@@ -0,0 +1,95 @@
+import argparse
+import importlib
+import re
+import time
+from pathlib import Path
+
+DAY_MODULE = re.compile(r"^day(\d+)\.py$")
+
+PART_NAMES = {1: "One", 2: "Two"}
+
+
+def discover_days(directory=Path(__file__).parent):
+    days = {}
+
+    for path in Path(directory).glob("day*.py"):
+        match = DAY_MODULE.match(path.name)
+        if match is not None:
+            days[int(match.groups()[0])] = path.stem
+
+    return dict(sorted(days.items()))
+
+
+INPUT_DIRECTORY = Path(__file__).parent / "input"
+
+
+def input_filename(day, example=False):
+    # Next to the solvers, wherever run.py is run from
+    if example:
+        return str(INPUT_DIRECTORY / f"day{day}-example.txt")
+    else:
+        return str(INPUT_DIRECTORY / f"day{day}-actual.txt")
+
+
+def load_day(day):
+    days = discover_days()
+
+    if day not in days:
+        raise ValueError(f"No solver found for day {day}")
+
+    return importlib.import_module(days[day])
+
+
+def phase_name(part):
+    return f"part_{PART_NAMES[part].lower()}"
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def run_day(day, parts=(1, 2), filename=None, example=False):
+    module = load_day(day)
+
+    if filename is None:
+        filename = input_filename(day, example)
+
+    puzzle_input, parse_time = timed(module.read_input, filename)
+
+    results = {}
+    for part in parts:
+        solver = getattr(module, phase_name(part))
+        results[part] = timed(solver, puzzle_input)
+
+    return parse_time, results
+
+
+def format_time(seconds):
+    return f"{seconds * 1000:.3f} ms"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Advent of Code solvers with per-phase timings")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-p", "--part", type=int, choices=sorted(PART_NAMES), action="append",
+                        help="part to run, may be repeated (default: both)")
+    parser.add_argument("-e", "--example", action="store_true", help="use the example input")
+    parser.add_argument("-i", "--input", help="input file to use instead of the puzzle input")
+    args = parser.parse_args(argv)
+
+    days = args.days or list(discover_days())
+    parts = args.part or sorted(PART_NAMES)
+
+    for day in days:
+        parse_time, results = run_day(day, parts, args.input, args.example)
+
+        print(f"Day {day}:")
+        print(f"  Parse: {format_time(parse_time)}")
+        for part, (answer, part_time) in results.items():
+            print(f"  Part {PART_NAMES[part]}: {answer} ({format_time(part_time)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from day1 import part_one, part_two, input, read_input, elf_totals, top_calories, chunk_boundaries, parallel_top_calories
+
+
+class Day1Tests(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(part_one(input(example=True)), 24_000)
+        self.assertEqual(part_two(input(example=True)), 45_000)
+
+    def test_elf_totals(self):
+        self.assertEqual(list(elf_totals(input(example=True))), [6_000, 4_000, 11_000, 24_000, 10_000])
+
+    def test_top_calories(self):
+        self.assertEqual(top_calories(input(example=True), 2), [24_000, 11_000])
+        self.assertEqual(part_two(input(example=True), k=5), 55_000)
+
+    def test_top_calories_streams_lines(self):
+        lines = iter(["1", "2", "", "5", "", "4"])
+
+        self.assertEqual(top_calories(lines, 2), [5, 4])
+
+    def test_chunk_boundaries_split_between_elves(self):
+        data = open("input/day1-example.txt", "rb").read()
+
+        bounds = chunk_boundaries(data, 10)
+
+        self.assertEqual(bounds[0], 0)
+        self.assertEqual(bounds[-1], len(data))
+        for bound in bounds[1:-1]:
+            self.assertEqual(data[bound - 1:bound + 1], b"\n\n")
+
+    def test_parallel_top_calories(self):
+        self.assertEqual(parallel_top_calories("input/day1-example.txt", 3, workers=2, chunk_size=10),
+                         [24_000, 11_000, 10_000])
+        self.assertEqual(parallel_top_calories("input/day1-actual.txt", 3, workers=2, chunk_size=1024),
+                         top_calories(input(example=False), 3))
+
+    def test_parallel_top_calories_crlf(self):
+        data = open("input/day1-example.txt", "rb").read().replace(b"\n", b"\r\n")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "crlf.txt")
+            with open(filename, "wb") as f:
+                f.write(data)
+
+            expected = top_calories(read_input(filename), 3)
+            self.assertEqual(expected, [24_000, 11_000, 10_000])
+            for chunk_size in (10, 1024):
+                self.assertEqual(parallel_top_calories(filename, 3, workers=2, chunk_size=chunk_size), expected)
@@ -0,0 +1,67 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from day2 import *
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class Day2Tests(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(part_one(input(example=True)), 15)
+        self.assertEqual(part_two(input(example=True)), 12)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_vectorized_scores(self):
+        self.assertEqual(vectorized_scores("input/day2-example.txt"), (15, 12))
+
+        actual = input(example=False)
+        self.assertEqual(vectorized_scores("input/day2-actual.txt"), (part_one(actual), part_two(actual)))
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_vectorized_scores_line_endings(self):
+        data = open("input/day2-example.txt", "rb").read().rstrip()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "rounds.txt")
+
+            for variant in (data.replace(b"\n", b"\r\n") + b"\r\n", data + b"\n\n", data + b"\n  \n"):
+                with open(filename, "wb") as f:
+                    f.write(variant)
+                self.assertEqual(vectorized_scores(filename), (15, 12))
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_vectorized_scores_malformed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "rounds.txt")
+
+            for variant in (b"A Y\nB-X\nC Z\n", b"A Y\nD X\nC Z\n", b"A Y\nB W\nC Z\n", b"A Y\nB X \nC Z\n", b"A Y\n\nB X\n"):
+                with open(filename, "wb") as f:
+                    f.write(variant)
+                with self.assertRaises(ValueError):
+                    vectorized_scores(filename)
+
+    def test_strategy_histogram(self):
+        self.assertEqual(strategy_histogram(input(example=True)), [[0, 1, 0], [1, 0, 0], [0, 0, 1]])
+
+    def test_strategy_histogram_malformed(self):
+        self.assertEqual(part_one(['A Y', '', 'B X', '']), 9)
+
+        for rounds in (['A Y', 'garbage', 'D X', ''], ['A Y', 'A  Y'], ['AY']):
+            with self.assertRaises(ValueError):
+                part_one(rounds)
+
+    def test_mapping_scores_match_parts(self):
+        self.assertEqual(shape_mapping_scores(score_per_shape), part_one_scores)
+        self.assertEqual(outcome_mapping_scores(score_by_outcome), part_two_scores)
+
+    def test_all_shape_decodings(self):
+        histogram = strategy_histogram(input(example=True))
+
+        decodings = all_shape_decodings(histogram)
+
+        self.assertEqual(len(decodings), 6)
+        self.assertIn(({'X': rock_score, 'Y': paper_score, 'Z': scissors_score}, 15), decodings)
+        # Reading every column as the opponent's own shape draws all three rounds
+        self.assertIn(({'X': paper_score, 'Y': rock_score, 'Z': scissors_score}, 3 + 3 + 3 + 2 + 1 + 3), decodings)
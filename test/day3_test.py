@@ -0,0 +1,54 @@
+import unittest
+from day3 import *
+
+
+class Day3Tests(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(part_one(input(example=True)), 157)
+        self.assertEqual(part_two(input(example=True)), 70)
+
+    def test_value_of_item(self):
+        self.assertEqual(value_of_item('a'), 1)
+        self.assertEqual(value_of_item('z'), 26)
+        self.assertEqual(value_of_item('A'), 27)
+        self.assertEqual(value_of_item('Z'), 52)
+
+        for letter in ('1', ' ', 'é', '\u20ac'):
+            with self.assertRaises(ValueError):
+                value_of_item(letter)
+
+    def test_find_common_item(self):
+        self.assertEqual(find_common_item("vJrwpWtwJgWrhcsFMMfFFhFp"), 'p')
+        self.assertEqual(find_common_item("jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL"), 'L')
+
+    def test_find_common_item_missing(self):
+        with self.assertRaises(ValueError):
+            find_common_item("abcd")
+
+    def test_long_rucksacks(self):
+        # Past SCAN_LIMIT the halves are intersected as sets
+        first = "b" * 2 * SCAN_LIMIT + "a"
+        second = "c" * 2 * SCAN_LIMIT + "a"
+
+        self.assertEqual(find_common_item(first + second), 'a')
+        self.assertEqual(find_badge([first, second, "a" + "d" * SCAN_LIMIT]), 'a')
+
+        with self.assertRaises(ValueError):
+            find_common_item("b" * 2 * SCAN_LIMIT + "c" * 2 * SCAN_LIMIT)
+
+    def test_find_badge(self):
+        group = input(example=True)[:3]
+
+        self.assertEqual(find_badge(group), 'r')
+
+    def test_rucksack_groups_are_lazy(self):
+        rucksacks = iter(input(example=True))
+
+        groups = rucksack_groups(rucksacks)
+        next(groups)
+
+        self.assertEqual(len(list(rucksacks)), 3)
+
+    def test_rucksack_groups_incomplete(self):
+        with self.assertRaises(ValueError):
+            list(rucksack_groups(input(example=True)[:4]))
@@ -0,0 +1,73 @@
+import importlib.util
+import random
+import unittest
+from day4 import *
+from generators import generate_day4
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class Day4Tests(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(part_one(input(example=True)), 2)
+        self.assertEqual(part_two(input(example=True)), 4)
+
+    def test_overlaps(self):
+        self.assertTrue(overlaps((5, 7), (7, 9)))
+        self.assertTrue(overlaps((6, 6), (4, 6)))
+        self.assertFalse(overlaps((2, 3), (4, 5)))
+        self.assertFalse(overlaps((4, 5), (2, 3)))
+
+    def test_large_section_ids(self):
+        pairs = [["1-50000000", "49999999-90000000"], ["1-50000000", "50000001-90000000"]]
+
+        self.assertEqual(part_one(pairs), 0)
+        self.assertEqual(part_two(pairs), 1)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_vectorized_counts(self):
+        self.assertEqual(vectorized_counts("input/day4-example.txt"), (2, 4))
+
+        actual = input(example=False)
+        self.assertEqual(vectorized_counts("input/day4-actual.txt"), (part_one(actual), part_two(actual)))
+
+    def test_coverage(self):
+        pairs = input(example=True)
+
+        self.assertEqual(most_covered_section(pairs), (6, 8))
+        self.assertEqual(sections_covered_at_least(pairs, 1), 8)
+        self.assertEqual(sections_covered_at_least(pairs, 6), 4)
+
+    def test_coverage_matches_counting_every_section(self):
+        rng = random.Random(4)
+        pairs = list(generate_day4(50, rng, max_section=30))
+        pairs = [line.split(',') for line in pairs]
+
+        counts = {}
+        for pair in pairs:
+            for assignment in pair:
+                start, end = parse_assignment(assignment)
+                for section in range(start, end + 1):
+                    counts[section] = counts.get(section, 0) + 1
+
+        most = max(counts.values())
+        self.assertEqual(most_covered_section(pairs), (min(s for s, c in counts.items() if c == most), most))
+        for k in (1, 5, 10):
+            self.assertEqual(sections_covered_at_least(pairs, k), len([c for c in counts.values() if c >= k]))
+
+    def test_overlapping_pairs(self):
+        pairs = [["1-2", "3-4"], ["10-12", "20-20"], ["4-5", "30-31"], ["7-8", "12-15"], ["40-40", "40-41"]]
+
+        self.assertEqual(overlapping_pairs(pairs), [0, 1, 2, 3])
+
+    def test_overlapping_pairs_matches_checking_every_pair(self):
+        rng = random.Random(12)
+        pairs = [line.split(',') for line in generate_day4(200, rng, max_section=400)]
+        parsed = [[parse_assignment(a) for a in pair] for pair in pairs]
+
+        expected = [
+            i for i, pair in enumerate(parsed)
+            if any(overlaps(a, b) for j, other in enumerate(parsed) if j != i for a in pair for b in other)
+        ]
+
+        self.assertEqual(overlapping_pairs(pairs), expected)
@@ -0,0 +1,161 @@
+import os
+import random
+import tempfile
+import unittest
+from day5 import *
+from generators import generate_day5
+
+
+class Day5Tests(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(part_one(get_input(example=True)), "CMZ")
+        self.assertEqual(part_two(get_input(example=True)), "MCD")
+
+    def test_get_stacks(self):
+        self.assertEqual(get_stacks(get_input(example=True)), [['Z', 'N'], ['M', 'C', 'D'], ['P']])
+
+    def test_parse_movement_long_numbers(self):
+        self.assertEqual(parse_movement("move 1234 from 105 to 7\n"), ('1234', '105', '7'))
+
+    def test_move_crates(self):
+        stacks = [['A', 'B', 'C'], ['D']]
+
+        move_crates(stacks, 2, 1, 2)
+        self.assertEqual(stacks, [['A'], ['D', 'C', 'B']])
+
+        move_crates(stacks, 3, 2, 1, keep_order=True)
+        self.assertEqual(stacks, [['A', 'D', 'C', 'B'], []])
+
+        move_crates(stacks, 0, 1, 2)
+        self.assertEqual(stacks, [['A', 'D', 'C', 'B'], []])
+
+        move_crates(stacks, 3, 1, 1)
+        self.assertEqual(stacks, [['A', 'D', 'C', 'B'], []])
+
+    def test_many_stacks(self):
+        input = [
+            " ".join("[X]" if i == 0 else "   " for i in range(12)) + "\n",
+            " ".join(f"{i + 1:^3}" for i in range(12)) + "\n",
+            "\n",
+            "move 1 from 1 to 12\n",
+        ]
+
+        stacks = get_stacks(input)
+        self.assertEqual(len(stacks), 12)
+
+        move_crates(stacks, 1, 1, 12)
+        self.assertEqual(stacks[11], ['X'])
+
+    def test_trace_top_crates(self):
+        self.assertEqual(trace_top_crates(get_input(example=True)), "CMZ")
+        self.assertEqual(trace_top_crates(get_input(example=True), keep_order=True), "MCD")
+
+    def test_trace_top_crates_matches_simulation(self):
+        actual = get_input(example=False)
+        self.assertEqual(trace_top_crates(actual), part_one(actual))
+        self.assertEqual(trace_top_crates(actual, keep_order=True), part_two(actual))
+
+        generated = [line + "\n" for line in generate_day5(2_000, random.Random(5), num_stacks=15, max_count=200)]
+        self.assertEqual(trace_top_crates(generated), part_one(generated))
+        self.assertEqual(trace_top_crates(generated, keep_order=True), part_two(generated))
+
+    def test_trace_top_crates_same_stack(self):
+        input = [
+            "[A]        \n",
+            "[B] [C]    \n",
+            "[D] [E]    \n",
+            " 1   2   3 \n",
+            "\n",
+            "move 1 from 1 to 1\n",
+            "move 1 from 1 to 2\n",
+            "move 2 from 2 to 2\n",
+        ]
+
+        self.assertEqual(trace_top_crates(input), "BA ")
+        self.assertEqual(trace_top_crates(input, keep_order=True), "BA ")
+        self.assertEqual(run_both_cranes(*compile_input(input)), ("BA ", "BA "))
+
+    def test_compile_moves(self):
+        self.assertEqual(list(compile_moves(get_input(example=True))), [1, 2, 1, 3, 1, 3, 2, 2, 1, 1, 1, 2])
+
+    def test_compile_moves_malformed(self):
+        drawing = get_input(example=True)[:5]
+
+        for moves in (["move 1 from 2\n", "move 1 from 2 to 3 4\n"], ["1 2 3\n"], ["move 1 from 2 to 3 and 4\n"]):
+            with self.assertRaises(ValueError):
+                compile_moves(drawing + moves)
+
+        self.assertEqual(list(compile_moves(drawing + ["move 1 from 2 to 1\r\n", "\n", "move 2 from 1 to 3  \n"])), [1, 2, 1, 2, 1, 3])
+
+    def test_run_both_cranes(self):
+        stacks, program = compile_input(get_input(example=True))
+
+        self.assertEqual(run_both_cranes(stacks, program), ("CMZ", "MCD"))
+        # The compiled input is reusable
+        self.assertEqual(run_program(stacks, program), "CMZ")
+        self.assertEqual(run_both_cranes(stacks, program), ("CMZ", "MCD"))
+
+    def test_crane_simulator_follows_log(self):
+        # The last move only counts once its line is finished
+        lines = [line.rstrip('\n') + '\n' for line in get_input(example=False)]
+        split_point = lines.index('\n')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            log = os.path.join(tmp, "crane.log")
+            checkpoint = os.path.join(tmp, "crane.json")
+
+            with open(log, "w") as f:
+                f.writelines(lines[:split_point + 200])
+                # A move that is still being written
+                f.write(lines[split_point + 200][:6])
+
+            simulator = CraneSimulator.from_log(log)
+            simulator.sync(log, checkpoint, checkpoint_every=50)
+            self.assertEqual(simulator.moves_applied, 199)
+
+            with open(log, "a") as f:
+                f.write(lines[split_point + 200][6:])
+                f.writelines(lines[split_point + 201:])
+
+            resumed = CraneSimulator.resume(checkpoint, log)
+            self.assertEqual(resumed.moves_applied, 199)
+            self.assertEqual(resumed.sync(log), part_one(lines))
+            self.assertEqual(simulator.sync(log), part_one(lines))
+
+    def test_crane_simulator_final_line_without_newline(self):
+        # The actual input has no newline after its last move
+        filename = f"input/day{DAY}-actual.txt"
+        actual = get_input(example=False)
+
+        simulator = CraneSimulator.from_log(filename)
+        simulator.sync(filename)
+        self.assertEqual(simulator.moves_applied, len(compile_moves(actual)) // 3 - 1)
+
+        self.assertEqual(simulator.sync(filename, final=True), part_one(actual))
+        self.assertEqual(simulator.moves_applied, len(compile_moves(actual)) // 3)
+        self.assertEqual(simulator.offset, os.path.getsize(filename))
+
+        # Nothing is applied twice
+        self.assertEqual(simulator.sync(filename, final=True), part_one(actual))
+
+    def test_crane_simulator_checkpoint_every_needs_checkpoint(self):
+        simulator = CraneSimulator.from_log(f"input/day{DAY}-example.txt")
+
+        with self.assertRaises(ValueError):
+            simulator.sync(f"input/day{DAY}-example.txt", checkpoint_every=2)
+
+    def test_crane_simulator_checkpoints(self):
+        lines = [line.rstrip('\n') + '\n' for line in get_input(example=True)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            log = os.path.join(tmp, "crane.log")
+            checkpoint = os.path.join(tmp, "crane.json")
+            with open(log, "w") as f:
+                f.writelines(lines)
+
+            simulator = CraneSimulator.resume(checkpoint, log, keep_order=True)
+            simulator.sync(log, checkpoint, checkpoint_every=2)
+
+            saved = CraneSimulator.load(checkpoint)
+            self.assertEqual(saved.snapshot(), simulator.snapshot())
+            self.assertEqual(saved.tops(), "MCD")
@@ -1,5 +1,11 @@
+import asyncio
+import importlib.util
+import random
+import socket
 import unittest
-from day6 import part_one, part_two
+from day6 import *
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
 
 
 class Day6Tests(unittest.TestCase):
@@ -27,3 +33,81 @@ class Day6Tests(unittest.TestCase):
         string = "zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw"
         self.assertEqual(part_one(string), 11)
         self.assertEqual(part_two(string), 26)
+
+    def test_find_markers(self):
+        string = "mjqjpqmgbljsphdztnvjfqwrcgsmlb"
+        self.assertEqual(find_markers(string, [4, 14]), {4: 7, 14: 19})
+        self.assertEqual(find_markers(string, [14, 1, 4, 2]), {1: 1, 2: 2, 4: 7, 14: 19})
+
+    def test_find_markers_missing(self):
+        self.assertEqual(find_markers("abcabcabc", [3, 4]), {3: 3})
+        self.assertIsNone(part_one("aaaa"))
+
+    def test_find_markers_matches_every_window(self):
+        buffer = get_input().strip()
+        for length in range(1, 20):
+            expected = next(
+                (i + length for i in range(len(buffer)) if len(set(buffer[i:i + length])) == length),
+                None,
+            )
+            self.assertEqual(find_end_of_first_marker(buffer, length), expected)
+
+    def test_marker_detector_across_chunks(self):
+        detector = MarkerDetector([4, 14])
+
+        self.assertEqual(detector.feed(b"mjqj"), [])
+        self.assertEqual(detector.feed(b"pqm"), [(4, 7)])
+        self.assertEqual(detector.feed(b"gbljsphdz"), [])
+        self.assertEqual(detector.feed(b"tnvjfqwrcgsmlb"), [(14, 19)])
+        self.assertTrue(detector.done())
+
+    def test_marker_detector_ignores_line_endings(self):
+        for chunks in (["aaabc\n"], [b"aaabc\r\n"], ["aaab", "\nc", "\n"]):
+            detector = MarkerDetector([4])
+            for chunk in chunks:
+                self.assertEqual(detector.feed(chunk), [])
+            self.assertEqual(detector.position, 5)
+
+        self.assertEqual(MarkerDetector([4]).feed("ab\ncd\n"), [(4, 4)])
+
+    def test_detect_markers_from_stream(self):
+        data = get_input().encode()
+
+        async def stream_markers():
+            reading, writing = socket.socketpair()
+            reader, reading_writer = await asyncio.open_connection(sock=reading)
+            _, writer = await asyncio.open_connection(sock=writing)
+
+            async def send():
+                for i in range(0, len(data), 100):
+                    writer.write(data[i:i + 100])
+                    await writer.drain()
+                writer.close()
+
+            sender = asyncio.create_task(send())
+            markers = [marker async for marker in detect_markers(reader, [4, 14], chunk_size=7)]
+            await sender
+            reading_writer.close()
+            return markers
+
+        self.assertEqual(asyncio.run(stream_markers()), [(4, part_one(data.decode())), (14, part_two(data.decode()))])
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_batch_find_markers(self):
+        rng = random.Random(6)
+        buffers = [
+            "mjqjpqmgbljsphdztnvjfqwrcgsmlb",
+            "nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg",
+            "abc",
+            "",
+            b"zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw\n",
+        ] + ["".join(rng.choice("abcdefghijklmnop") for _ in range(rng.randint(0, 80))) for _ in range(200)]
+
+        markers = batch_find_markers(buffers, [4, 14])
+
+        for i, buffer in enumerate(buffers):
+            if isinstance(buffer, bytes):
+                buffer = buffer.decode()
+            expected = find_markers(buffer.strip(), [4, 14])
+            self.assertEqual(markers[4][i], expected.get(4, -1), buffer)
+            self.assertEqual(markers[14][i], expected.get(14, -1), buffer)
@@ -1,5 +1,12 @@
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
 import unittest
-from day7 import part_one, input, process_terminal_output
+from day7 import *
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
 
 class Day7Tests(unittest.TestCase):
 
@@ -59,3 +66,218 @@ class Day7Tests(unittest.TestCase):
         print(exp)
 
         self.assertEqual(dir.describe(),exp)
+
+    def test_size_cache_invalidated_by_add_child(self):
+        root = Directory("/", None)
+        child = Directory("a", "/")
+        root.add_child(child)
+        child.add_child(File("x", 10))
+
+        self.assertEqual(root.size(), 10)
+        self.assertEqual(child.size(), 10)
+
+        grandchild = Directory("b", "a")
+        child.add_child(grandchild)
+        grandchild.add_child(File("y", 5))
+
+        self.assertEqual(root.size(), 15)
+        self.assertEqual(child.size(), 15)
+        self.assertEqual(grandchild.size(), 5)
+
+    def test_deep_tree(self):
+        root = Directory("/", None)
+        directory = root
+        for i in range(5_000):
+            child = Directory(f"d{i}", directory.name())
+            directory.add_child(child)
+            child.add_child(File("f", 1))
+            directory = child
+
+        self.assertEqual(root.size(), 5_000)
+        self.assertEqual(root.sum_of_small_dirs(10), 55)
+
+    def test_find_directory_by_path(self):
+        dir = process_terminal_output(input(example=True))
+
+        e = dir.find_directory('/a/e')
+        self.assertEqual(e.path(), '/a/e')
+        self.assertIs(dir.find_directory('a/e'), e)
+        self.assertIs(dir.find_directory('a').find_directory('e'), e)
+        self.assertIs(dir.find_directory('/'), dir)
+        self.assertIsNone(dir.find_directory('/e'))
+        self.assertIsNone(dir.find_directory('d').find_directory('e'))
+
+    def test_find_directory_in_attached_subtree(self):
+        root = Directory("/", None)
+        a = Directory("a", "/")
+        b = Directory("b", "a")
+        a.add_child(b)
+        root.add_child(a)
+
+        self.assertIs(root.find_directory('/a/b'), b)
+        self.assertIs(root.find_directory('b'), b)
+        self.assertIs(a.find_child_directory('b'), b)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_columnar_example(self):
+        tree = process_terminal_output(input(example=True), columnar=True)
+
+        self.assertEqual(tree.size(), 48_381_165)
+        self.assertEqual(tree.sum_of_small_dirs(100_000), 95_437)
+        self.assertEqual(sorted(tree.name(node) for node in tree.find_large_dirs(1_000_000)), ['/', 'd'])
+        self.assertEqual(tree.size(tree.find_child_directory(0, 'd')), 24_933_642)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_columnar_matches_objects(self):
+        lines = input(example=False)
+        dir = process_terminal_output(lines)
+        tree = process_terminal_output(lines, columnar=True)
+
+        self.assertEqual(tree.size(), dir.size())
+        self.assertEqual(tree.sum_of_small_dirs(100_000), dir.sum_of_small_dirs(100_000))
+        self.assertEqual(
+            sorted(tree.size(node) for node in tree.find_large_dirs(5_000_000)),
+            sorted(d.size() for d in dir.find_large_dirs(5_000_000)),
+        )
+
+    def test_stream_directory_sizes(self):
+        sizes = list(stream_directory_sizes(input(example=True)))
+
+        self.assertEqual(sizes, [('/a/e', 584), ('/a', 94_853), ('/d', 24_933_642), ('/', 48_381_165)])
+
+    def test_streaming_parts_match_tree(self):
+        for example in (True, False):
+            lines = input(example=example)
+            self.assertEqual(streaming_part_one(lines), part_one(lines))
+            self.assertEqual(streaming_part_two(lines), part_two(lines))
+
+    def test_streaming_rejects_reentered_directory(self):
+        lines = ["$ cd /", "$ ls", "dir a", "$ cd a", "$ ls", "200000 x", "dir b",
+                 "$ cd ..", "$ cd a", "$ cd b", "$ ls", "7 y"]
+
+        with self.assertRaises(ValueError):
+            streaming_part_one(lines)
+
+    def test_streaming_rejects_cd_out_of_root(self):
+        with self.assertRaises(ValueError):
+            list(stream_directory_sizes(["$ cd /", "$ cd ..", "$ ls", "10 a"]))
+
+    def test_streaming_skips_blank_lines(self):
+        lines = ["$ cd /\n", "$ ls\n", "10 a\n", "\n"]
+
+        self.assertEqual(list(stream_directory_sizes(lines)), [('/', 10)])
+
+    def test_streaming_reads_lines_lazily(self):
+        lines = iter(input(example=True))
+
+        first = next(stream_directory_sizes(lines))
+
+        self.assertEqual(first, ('/a/e', 584))
+        self.assertEqual(len(list(lines)), 7)
+
+    def test_size_index(self):
+        dir = process_terminal_output(input(example=True))
+
+        index = dir.size_index()
+
+        self.assertEqual(index.smallest_at_least(10_000_000).name(), 'd')
+        self.assertEqual(index.smallest_at_least(584).name(), 'e')
+        self.assertIsNone(index.smallest_at_least(50_000_000))
+        self.assertEqual([d.name() for d in index.largest(2)], ['/', 'd'])
+        self.assertEqual([d.name() for d in index.within(500, 100_000)], ['e', 'a'])
+        self.assertIs(dir.find_directory('a').size_index(), index)
+
+    def test_size_index_rebuilt_after_change(self):
+        dir = process_terminal_output(input(example=True))
+        index = dir.size_index()
+
+        dir.find_directory('e').add_child(File('big', 30_000_000))
+
+        self.assertIsNot(dir.size_index(), index)
+        self.assertEqual(dir.size_index().smallest_at_least(25_000_000).name(), 'e')
+
+    def test_terminal_parser_ingests_appended_output(self):
+        lines = input(example=False)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            capture = os.path.join(tmp, "capture.txt")
+
+            with open(capture, "w") as f:
+                f.write("\n".join(lines[:600]) + "\n" + lines[600][:3])
+
+            parser = TerminalParser()
+            first = parser.ingest(capture)
+            partial_size = first.size()
+
+            with open(capture, "a") as f:
+                f.write(lines[600][3:] + "\n" + "\n".join(lines[601:]) + "\n")
+
+            root = parser.ingest(capture)
+
+            self.assertIs(root, first)
+            self.assertGreater(root.size(), partial_size)
+            self.assertEqual(root.size(), process_terminal_output(lines).size())
+            self.assertEqual(root.sum_of_small_dirs(100_000), part_one(lines))
+            self.assertEqual(parser.ingest(capture).size(), root.size())
+
+    def test_terminal_parser_final_line_without_newline(self):
+        # The actual capture has no newline after its last listing
+        filename = f"input/day{DAY}-actual.txt"
+        expected = process_terminal_output(input(example=False)).size()
+
+        parser = TerminalParser()
+        self.assertLess(parser.ingest(filename).size(), expected)
+        self.assertEqual(parser.ingest(filename, final=True).size(), expected)
+        self.assertEqual(parser.offset, os.path.getsize(filename))
+        self.assertEqual(parser.ingest(filename, final=True).size(), expected)
+
+    def test_terminal_parser_keeps_lines_it_stopped_at(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            capture = os.path.join(tmp, "capture.txt")
+            with open(capture, "w") as f:
+                f.write("$ cd /\n$ ls\ndir a\n$ cd b\n$ ls\n10 x\n")
+
+            parser = TerminalParser()
+            with contextlib.redirect_stdout(io.StringIO()):
+                parser.ingest(capture)
+            self.assertEqual(parser.offset, len("$ cd /\n$ ls\ndir a\n"))
+
+            # Once b exists the rest of the capture is picked up
+            parser.root.add_child(Directory('b', '/'))
+            self.assertEqual(parser.ingest(capture).find_directory('b').size(), 10)
+
+    def test_terminal_parser_repeated_session(self):
+        session = "$ cd /\n$ ls\ndir a\n100 x\n$ cd a\n$ ls\n50 y\n"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            capture = os.path.join(tmp, "capture.txt")
+            with open(capture, "w") as f:
+                f.write(session)
+
+            parser = TerminalParser()
+            a = parser.ingest(capture).find_directory('a')
+            self.assertEqual(parser.root.size(), 150)
+
+            # The same session again, with a new file and a file that grew
+            with open(capture, "a") as f:
+                f.write(session + "60 z\n$ cd /\n$ ls\n120 x\n")
+
+            root = parser.ingest(capture)
+
+            self.assertEqual(root.size(), 230)
+            self.assertEqual([child.name() for child in root.children], ['a', 'x'])
+            self.assertIs(root.find_directory('a'), a)
+            self.assertIs(root.find_directory('/a'), a)
+            self.assertEqual(a.size(), 110)
+
+    def test_add_child_updates_cached_sizes(self):
+        dir = process_terminal_output(input(example=True))
+        e = dir.find_directory('e')
+        self.assertEqual(dir.size(), 48_381_165)
+
+        e.add_child(File('new', 16))
+
+        # Updated in place rather than cleared
+        self.assertEqual(e._size, 600)
+        self.assertEqual(dir.find_directory('a')._size, 94_869)
+        self.assertEqual(dir._size, 48_381_181)
@@ -0,0 +1,43 @@
+import os
+import random
+import tempfile
+import unittest
+from generators import GENERATORS, write_input
+from benchmark import benchmark_day
+from run import run_day
+
+
+class GeneratorTests(unittest.TestCase):
+    def test_every_day_solves_generated_input(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for day in GENERATORS:
+                size = 20 if day == 8 else 300
+                filename = write_input(day, size, os.path.join(tmp, f"day{day}.txt"))
+
+                _, results = run_day(day, filename=filename)
+
+                self.assertIsNotNone(results[1][0], day)
+                self.assertIsNotNone(results[2][0], day)
+
+    def test_generators_are_seeded(self):
+        first = list(GENERATORS[9](50, random.Random(3)))
+        second = list(GENERATORS[9](50, random.Random(3)))
+
+        self.assertEqual(first, second)
+
+    def test_day3_rucksacks_have_one_common_item(self):
+        rucksacks = list(GENERATORS[3](30, random.Random(0)))
+
+        for rucksack in rucksacks:
+            midway = len(rucksack) // 2
+            self.assertEqual(len(set(rucksack[:midway]) & set(rucksack[midway:])), 1)
+
+        for i in range(0, len(rucksacks), 3):
+            a, b, c = rucksacks[i:i + 3]
+            self.assertEqual(len(set(a) & set(b) & set(c)), 1)
+
+    def test_benchmark_day_reports_each_phase(self):
+        result = benchmark_day(2, 100)
+
+        self.assertEqual(result["day"], 2)
+        self.assertEqual(set(result["seconds"]), {"parse", "part_one", "part_two"})
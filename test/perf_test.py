@@ -0,0 +1,44 @@
+import os
+import unittest
+from benchmark import PERF_BASELINE, load_baseline, measure_day
+
+# Performance regression tests, skipped unless AOC_PERF is set:
+#
+#   AOC_PERF=1 python -m unittest discover -s ./test -p 'perf_test.py'
+#
+# Each day is run on a generated input of the size recorded in the baseline and
+# fails if time or peak memory of any phase is worse than the baseline by more
+# than the margin (AOC_PERF_MARGIN, default taken from the baseline file).
+# Times are medians in units of a calibration loop run just before each run
+# (see benchmark.calibrated_times), so a busy or slower machine moves both alike.
+# Re-measure the baseline with `python benchmark.py --write-baseline`.
+
+# Absolute slack so phases that take microseconds or a few KB don't fail on noise
+MIN_RELATIVE_SLACK = 0.1
+MIN_BYTES_SLACK = 64 * 1024
+
+
+@unittest.skipUnless(os.environ.get("AOC_PERF"), "set AOC_PERF=1 to run performance tests")
+class PerfTests(unittest.TestCase):
+    def setUp(self):
+        self.baseline = load_baseline(PERF_BASELINE)
+        self.margin = float(os.environ.get("AOC_PERF_MARGIN", self.baseline["margin"]))
+
+    def assertNotWorse(self, actual, expected, slack, message):
+        limit = max(expected * (1 + self.margin), expected + slack)
+        self.assertLessEqual(actual, limit, message)
+
+    def test_no_regressions(self):
+        for day, expected in self.baseline["days"].items():
+            actual = measure_day(int(day), expected["size"])
+
+            for phase, relative in expected["relative"].items():
+                with self.subTest(day=day, phase=phase, metric="relative"):
+                    self.assertNotWorse(actual["relative"][phase], relative, MIN_RELATIVE_SLACK,
+                                        f"Day {day} {phase} took {actual['relative'][phase]:.3f} calibration loops, "
+                                        f"baseline {relative:.3f}")
+
+            for phase, peak in expected["peak_bytes"].items():
+                with self.subTest(day=day, phase=phase, metric="peak_bytes"):
+                    self.assertNotWorse(actual["peak_bytes"][phase], peak, MIN_BYTES_SLACK,
+                                        f"Day {day} {phase} peaked at {actual['peak_bytes'][phase]} bytes, baseline {peak}")
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from run import discover_days, input_filename, run_day
+
+
+class RunTests(unittest.TestCase):
+    def test_discover_days(self):
+        days = discover_days()
+
+        self.assertEqual(list(days), list(range(1, 10)))
+        self.assertEqual(days[7], "day7")
+
+    def test_run_day(self):
+        parse_time, results = run_day(7, example=True)
+
+        self.assertGreaterEqual(parse_time, 0)
+        self.assertEqual(results[1][0], 95_437)
+        self.assertEqual(results[2][0], 24_933_642)
+
+    def test_run_from_another_directory(self):
+        self.assertTrue(Path(input_filename(1)).is_absolute())
+
+        result = subprocess.run(
+            [sys.executable, str(Path(__file__).parent.parent / "run.py"), "1", "--example"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Part Two: 45000", result.stdout)
+
+    def test_run_single_part(self):
+        _, results = run_day(9, parts=(2,), example=True)
+
+        self.assertEqual(list(results), [2])
+        self.assertEqual(results[2][0], 1)
+
+    def test_imports_have_no_side_effects(self):
+        for module_name in list(discover_days().values()) + ["dayX"]:
+            # A fresh interpreter per module, so the modules other tests
+            # imported are left alone
+            result = subprocess.run(
+                [sys.executable, "-c", f"import {module_name}"],
+                capture_output=True,
+                text=True,
+                cwd=Path(__file__).parent.parent,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(result.stdout, "", module_name)